@@ -15,7 +15,7 @@ _PLAYER_LABEL_SEPARATOR = " | "
 _MULTI_TEAM_MARKERS = {"TOT", "2TM", "3TM", "4TM", "5TM"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeneratorFieldDisplayRow:
     section: str
     group: str
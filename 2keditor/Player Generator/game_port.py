@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import re
+import sys
 import unicodedata
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Iterable
 
@@ -181,17 +184,24 @@ def apply_generated_players_to_game(
     extra_row_tuple = tuple(extra_rows)
     allowed_sections = frozenset(str(section) for section in include_sections) if include_sections is not None else None
     total_players = len(generated_tuple)
+    authored = _model_player_field_index(model)
+    record_addresses = _player_record_addresses(model, index_tuple)
+    apply_rows = _apply_rows_with_field_index
+    rows_for_import = _generated_rows_for_import
+    append_result = player_results.append
     if progress_callback is not None:
         progress_callback(0, total_players, f"Preparing to import {total_players} generated players")
     for imported_count, (generated, player_index) in enumerate(zip(generated_tuple, index_tuple), start=1):
-        player_results.append(
-            apply_generated_rows_to_game(
+        if player_index < 0:
+            raise ValueError("player_index must be >= 0")
+        append_result(
+            apply_rows(
                 model,
-                (*tuple(_generated_rows_for_import(generated, allowed_sections)), *extra_row_tuple),
+                (*rows_for_import(generated, allowed_sections), *extra_row_tuple),
                 player_index=player_index,
-                field_index=field_index,
-                offsets_path=offsets_path,
+                authored=authored,
                 stop_on_error=stop_on_error,
+                record_addresses=record_addresses,
             )
         )
         if progress_callback is not None:
@@ -261,12 +271,30 @@ _FIRST_NAME_ALIASES: dict[str, tuple[str, ...]] = {
 }
 
 _NAME_SUFFIXES = {"JR", "SR", "II", "III", "IV", "V"}
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]+")
+_RECORD_INDEX_PREFIX_RE = re.compile(r"^\s*\[\d+\]\s*")
+
+
+# Last name index built, keyed by the loaded Players container it was built from.
+_PLAYERS_BY_NAME_CACHE: list[tuple[Any, int, dict[str, tuple[Any, ...]]]] = []
 
 
 def _loaded_players_by_name_key(model: Any) -> dict[str, tuple[Any, ...]]:
-    raw: dict[str, list[Any]] = {}
     loaded = getattr(model, "loaded_items", {})
     players = loaded.get("Players", {}) if isinstance(loaded, dict) else {}
+    if not isinstance(players, (dict, list, tuple)):
+        return {}
+    if _PLAYERS_BY_NAME_CACHE:
+        cached_players, cached_len, cached_index = _PLAYERS_BY_NAME_CACHE[0]
+        if cached_players is players and cached_len == len(players):
+            return cached_index
+    index = _build_players_by_name_key(players)
+    _PLAYERS_BY_NAME_CACHE[:] = [(players, len(players), index)]
+    return index
+
+
+def _build_players_by_name_key(players: Any) -> dict[str, tuple[Any, ...]]:
+    raw: defaultdict[str, list[Any]] = defaultdict(list)
     if isinstance(players, dict):
         iterable = players.items()
     elif isinstance(players, (list, tuple)):
@@ -274,13 +302,14 @@ def _loaded_players_by_name_key(model: Any) -> dict[str, tuple[Any, ...]]:
     else:
         iterable = ()
     for label, item in iterable:
-        for value in _loaded_player_name_values(label, item):
+        # The record label usually repeats across label/display_label; key each spelling once.
+        for value in dict.fromkeys(_loaded_player_name_values(label, item)):
             try:
                 keys = _person_name_keys(value)
             except Exception:
                 keys = ()
             for key in keys:
-                raw.setdefault(key, []).append(item)
+                raw[key].append(item)
     return {key: _unique_items_by_index(items) for key, items in raw.items()}
 
 
@@ -337,14 +366,24 @@ def _generated_player_name_keys(generated: Any) -> tuple[str, ...]:
 
 
 def _person_name_keys(*values: object) -> tuple[str, ...]:
+    if len(values) == 1:
+        return _name_text_keys(str(values[0] or ""))
     keys: list[str] = []
     for value in values:
-        exact = _identity(value)
-        if exact:
-            keys.append(exact)
-        tokens = _name_tokens(value)
-        if not tokens:
-            continue
+        keys.extend(_name_text_keys(str(value or "")))
+    return tuple(dict.fromkeys(keys))
+
+
+# Every roster rebuild and generated-player match re-keys the same spellings; derive each once
+# and intern the keys so index lookups compare by identity.
+@lru_cache(maxsize=8192)
+def _name_text_keys(text: str) -> tuple[str, ...]:
+    keys: list[str] = []
+    exact = _identity(text)
+    if exact:
+        keys.append(exact)
+    tokens = _name_tokens(text)
+    if tokens:
         without_suffix = tuple(token for token in tokens if token not in _NAME_SUFFIXES)
         if without_suffix and without_suffix != tokens:
             keys.append("".join(without_suffix))
@@ -354,16 +393,16 @@ def _person_name_keys(*values: object) -> tuple[str, ...]:
             keys.append(first + last)
             for alias in _FIRST_NAME_ALIASES.get(first, ()):
                 keys.append(alias + last)
-    return tuple(dict.fromkeys(key for key in keys if key))
+    return tuple(sys.intern(key) for key in dict.fromkeys(keys) if key)
 
 
 def _name_tokens(value: object) -> tuple[str, ...]:
     text = _ascii_name_text(value).upper()
-    return tuple(token for token in re.split(r"[^A-Z0-9]+", text) if token)
+    return tuple(token for token in _NON_ALNUM_RE.split(text) if token)
 
 
 def _strip_record_index_prefix(value: object) -> str:
-    return re.sub(r"^\s*\[\d+\]\s*", "", str(value or "")).strip()
+    return _RECORD_INDEX_PREFIX_RE.sub("", str(value or "")).strip()
 
 
 def validate_generated_player_names_match_offsets(
@@ -415,29 +454,26 @@ def _player_team_slot_indices_for_generated(model: Any, generated_players: tuple
 
     assigned_addresses = {int(team.address) for team in team_by_generated_key.values()}
     target_count = sum(min(len(player_indices_by_team_address.get(address, ())), _TEAM_SLOT_LIMIT) for address in assigned_addresses)
-    used_offsets: dict[int, int] = {}
+    slot_queues: dict[int, deque[int]] = {}
     used_player_indices: set[int] = set()
     indices: list[int] = []
 
     def take_slot(address: int, *, assigned: bool) -> int | None:
-        team_player_indices = player_indices_by_team_address.get(address, ())
-        limit = min(len(team_player_indices), _TEAM_SLOT_LIMIT) if assigned else len(team_player_indices)
-        offset = used_offsets.get(address, 0)
-        while offset < limit and team_player_indices[offset] in used_player_indices:
-            offset += 1
-        used_offsets[address] = offset
-        if offset >= limit:
-            return None
-        player_index = team_player_indices[offset]
-        used_offsets[address] = offset + 1
-        used_player_indices.add(player_index)
-        return player_index
+        queue = slot_queues.get(address)
+        if queue is None:
+            team_player_indices = player_indices_by_team_address.get(address, ())
+            queue = slot_queues[address] = deque(team_player_indices[:_TEAM_SLOT_LIMIT] if assigned else team_player_indices)
+        while queue:
+            player_index = queue.popleft()
+            if player_index not in used_player_indices:
+                used_player_indices.add(player_index)
+                return player_index
+        return None
+
+    spill_addresses = [address for address in (int(team.address) for team in teams) if address not in assigned_addresses]
 
     def take_spill_slot() -> int | None:
-        for team in teams:
-            address = int(team.address)
-            if address in assigned_addresses:
-                continue
+        for address in spill_addresses:
             player_index = take_slot(address, assigned=False)
             if player_index is not None:
                 return player_index
@@ -446,6 +482,7 @@ def _player_team_slot_indices_for_generated(model: Any, generated_players: tuple
     for generated in generated_players:
         generated_key = _generated_team_key(generated)
         live_team = team_by_generated_key.get(generated_key)
+        live_address = int(getattr(live_team, "address", -1))
         player_index: int | None = None
 
         for alternate_key in _generated_alternate_team_keys(generated):
@@ -453,14 +490,14 @@ def _player_team_slot_indices_for_generated(model: Any, generated_players: tuple
             if alternate_team is None:
                 continue
             alternate_address = int(alternate_team.address)
-            if alternate_address == int(getattr(live_team, "address", -1)):
+            if alternate_address == live_address:
                 continue
             player_index = take_slot(alternate_address, assigned=True)
             if player_index is not None:
                 break
 
         if player_index is None and live_team is not None:
-            player_index = take_slot(int(live_team.address), assigned=True)
+            player_index = take_slot(live_address, assigned=True)
         if player_index is None:
             player_index = take_spill_slot()
         if player_index is not None:
@@ -678,26 +715,33 @@ def _player_current_team_address(model: Any, player: Any) -> int | None:
     pointer_reader = getattr(model, "_player_current_team_pointer", None)
     if callable(pointer_reader):
         try:
-            value = pointer_reader(player)
-            return int(str(value)) if value is not None else None
+            return _team_address_int(pointer_reader(player))
         except Exception:
             return None
     team_address = getattr(player, "team_address", None)
     if team_address is not None:
         try:
-            return int(str(team_address))
+            return _team_address_int(team_address)
         except Exception:
             return None
     cache = getattr(model, "_player_team_pointer_cache", None)
     if isinstance(cache, dict):
-        value = cache.get(getattr(player, "index", None))
         try:
-            return int(str(value)) if value is not None else None
+            return _team_address_int(cache.get(getattr(player, "index", None)))
         except Exception:
             return None
     return None
 
 
+def _team_address_int(value: Any) -> int | None:
+    # Pointers come back as ints already; only text values need the strict decimal parse.
+    if value is None:
+        return None
+    if type(value) is int:
+        return value
+    return int(str(value))
+
+
 def _generated_team_key(generated: Any) -> str:
     for attr in ("team", "team_abbrev", "roster_team"):
         value = getattr(generated, attr, None)
@@ -730,11 +774,16 @@ def _generated_alternate_team_keys(generated: Any) -> tuple[str, ...]:
 
 
 def _identity(value: object) -> str:
-    return re.sub(r"[^A-Z0-9]+", "", _ascii_name_text(value).upper())
+    return _NON_ALNUM_RE.sub("", _ascii_name_text(value).upper())
 
 
 def _ascii_name_text(value: object) -> str:
-    text = str(value or "")
+    return _ascii_text(str(value or ""))
+
+
+# Roster and generated names repeat across every match pass; normalize each spelling once.
+@lru_cache(maxsize=8192)
+def _ascii_text(text: str) -> str:
     # Some historic/current source rows contain UTF-8 names decoded as Windows
     # text (DonÄ\x8diÄ‡, BogdanoviÄ‡, DiabatÃ©). Repair the common cases before
     # stripping accents so generated names can match NBA 2K's plain-ASCII names.
@@ -776,7 +825,27 @@ def apply_generated_rows_to_game(
 ) -> GamePortResult:
     if player_index < 0:
         raise ValueError("player_index must be >= 0")
-    authored = _model_player_field_index(model)
+    return _apply_rows_with_field_index(
+        model,
+        rows,
+        player_index=player_index,
+        authored=_model_player_field_index(model),
+        stop_on_error=stop_on_error,
+    )
+
+
+def _apply_rows_with_field_index(
+    model: Any,
+    rows: Iterable[Any],
+    *,
+    player_index: int,
+    authored: dict[str, FieldEntry],
+    stop_on_error: bool,
+    record_addresses: dict[int, int] | None = None,
+) -> GamePortResult:
+    write_entry_value = model.write_entry_value
+    record_addr, block = _player_write_block(model, player_index, record_addresses)
+    write_kwargs: dict[str, Any] = {"record_addr": record_addr, "memory": block} if block is not None else {}
     results: list[GamePortFieldResult] = []
     for row in _ordered_generated_rows_for_game_write(rows):
         field_key = str(getattr(row, "field_key", "")).strip()
@@ -784,7 +853,7 @@ def apply_generated_rows_to_game(
         try:
             attempted_value = _row_value(row)
             entry = authored[field_key]
-            readback = model.write_entry_value(entry, index=player_index, value=attempted_value)
+            readback = write_entry_value(entry, index=player_index, value=attempted_value, **write_kwargs)
             readback_value = readback.get("display_value") if isinstance(readback, dict) else readback
             results.append(
                 GamePortFieldResult(
@@ -814,6 +883,11 @@ def apply_generated_rows_to_game(
             )
             if stop_on_error:
                 break
+    if block is not None:
+        try:
+            block.flush()
+        except Exception as exc:
+            results = [result if not result.ok else replace(result, readback_value=None, ok=False, error=str(exc)) for result in results]
     succeeded = sum(1 for result in results if result.ok)
     failed = len(results) - succeeded
     return GamePortResult(
@@ -825,17 +899,54 @@ def apply_generated_rows_to_game(
     )
 
 
+def _player_record_addresses(model: Any, player_indices: Iterable[int]) -> dict[int, int] | None:
+    # Resolve the Players base once per batch instead of once per generated player.
+    resolver = getattr(model, "record_addresses", None)
+    if not callable(resolver):
+        return None
+    try:
+        return resolver("Players", player_indices)
+    except Exception:
+        return None
+
+
+def _player_write_block(model: Any, player_index: int, record_addresses: dict[int, int] | None = None) -> tuple[int | None, Any | None]:
+    # Generated rows touch most of the player record; stage them in one deferred
+    # block so the record is read once and written back in a single span.
+    block_reader = getattr(model, "record_block", None)
+    if not callable(block_reader):
+        return None, None
+    if record_addresses is not None and player_index in record_addresses:
+        record_addr = record_addresses[player_index]
+    else:
+        try:
+            record_addr = int(model.record_address("Players", player_index))
+        except Exception:
+            return None, None
+    return record_addr, block_reader("Players", record_addr, deferred=True)
+
+
 def _ordered_generated_rows_for_game_write(rows: Iterable[Any]) -> tuple[Any, ...]:
     materialized = tuple(rows)
     return tuple(sorted(materialized, key=_game_write_order_key))
 
 
+_CONTEST_SHOT_FIELD_KEY = sys.intern("Tendencies/CONTESTSHOT")
+
+
 def _game_write_order_key(row: Any) -> tuple[int, str]:
-    field_key = str(getattr(row, "field_key", "")).strip()
+    return _field_write_order_key(str(getattr(row, "field_key", "")))
+
+
+@lru_cache(maxsize=4096)
+def _field_write_order_key(raw_field_key: str) -> tuple[int, str]:
+    # Every generated player carries the same few hundred field keys; cache the
+    # key per spelling so a batch sort does not strip/compare them row by row.
+    field_key = sys.intern(raw_field_key.strip())
     # Main editor writes a single selected field. Generated import writes a packed
     # field batch; write Contest Shot after the surrounding defense tendency
     # package so the game-side visible T/CONTEST cell is the final write.
-    if field_key == "Tendencies/CONTESTSHOT":
+    if field_key is _CONTEST_SHOT_FIELD_KEY:
         return (1, field_key)
     return (0, field_key)
 
@@ -855,8 +966,7 @@ def _generated_rows_for_import(generated: Any, allowed_sections: frozenset[str]
             continue
         section = str(getattr(row, "section", ""))
         if not section:
-            field_key = str(getattr(row, "field_key", ""))
-            section = field_key.split("/", 1)[0]
+            section = _field_key_section(str(getattr(row, "field_key", "")))
         if section in allowed_sections:
             yield row
 
@@ -869,6 +979,11 @@ def _generated_rows(generated: Any) -> Iterable[Any]:
     raise AttributeError("generated player is missing field_candidates/rows")
 
 
+@lru_cache(maxsize=4096)
+def _field_key_section(field_key: str) -> str:
+    return sys.intern(field_key.split("/", 1)[0])
+
+
 def _field_key_name(field_key: str) -> str:
     return field_key.split("/", 1)[-1] if "/" in field_key else field_key
 
@@ -321,25 +321,30 @@ def per36(total: Optional[float], minutes: Optional[float]) -> Optional[float]:
     return None if r is None else r * 36.0
 
 
+_NON_LETTER_RE = re.compile(r"[^A-Z]+")
+_POSITION_TOKEN_RE = re.compile(r"\b(?:PG|SG|SF|PF|C)\b")
+_COMPACT_POSITION_MAP = {
+    "G": ("PG", "SG"),
+    "GF": ("SG", "SF"),
+    "FG": ("SF", "SG"),
+    "F": ("SF", "PF"),
+    "FC": ("PF", "C"),
+    "CF": ("C", "PF"),
+}
+
+
 def parse_positions(pos_text: object) -> tuple[str, ...]:
-    text = str(pos_text or "").upper()
-    compact = re.sub(r"[^A-Z]+", "", text)
-    position_map = {
-        "G": ("PG", "SG"),
-        "GF": ("SG", "SF"),
-        "FG": ("SF", "SG"),
-        "F": ("SF", "PF"),
-        "FC": ("PF", "C"),
-        "CF": ("C", "PF"),
-    }
-    mapped = position_map.get(compact)
+    return _parse_position_text(str(pos_text or "").upper())
+
+
+@lru_cache(maxsize=512)
+def _parse_position_text(text: str) -> tuple[str, ...]:
+    # Pool rows repeat a handful of position spellings; parse each once with precompiled patterns.
+    mapped = _COMPACT_POSITION_MAP.get(_NON_LETTER_RE.sub("", text))
     if mapped:
         return mapped
-    found = []
-    for pos in POSITIONS:
-        if re.search(rf"\b{pos}\b", text):
-            found.append(pos)
-    return tuple(dict.fromkeys(p for p in found if p in POSITIONS))
+    found = set(_POSITION_TOKEN_RE.findall(text))
+    return tuple(pos for pos in POSITIONS if pos in found)
 
 
 def live_features(stats: Dict[str, str]) -> Dict[str, Optional[float]]:
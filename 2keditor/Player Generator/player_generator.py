@@ -66,7 +66,7 @@ _PLAYER_CAREER_CONTEXT_SHEETS = {
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeneratedPlayerFieldCandidate:
     domain: str
     section: str
@@ -8,14 +8,14 @@ from player_evidence import PlayerEvidence
 from stat_neighbor_framework import hot_zone_neutral_values, load_latest_stat_neighbor_model, select_positions_from_evidence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileValue:
     value: int | str
     source_rule: str
     evidence_keys: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleValue:
     value: int | str
     source_rule: str
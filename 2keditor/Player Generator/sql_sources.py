@@ -11,7 +11,11 @@ from source_data import GeneratorSourceInventory
 _ARCHIVE_SQL_RELATIVE_PATH = Path("NBA_Database.sql")
 _ARCHIVE_SQLITE_RELATIVE_PATH = Path("nba.sqlite")
 _SQL_SERVER_CREATE_TABLE_RE = re.compile(r"CREATE\s+TABLE\s+\[dbo\]\.\[([^\]]+)\]", re.IGNORECASE)
-_SQL_SERVER_COLUMN_RE = re.compile(r"^\s*\[([^\]]+)\]\s+\[?([A-Za-z0-9_]+)\]?")
+_SQL_SERVER_COLUMN_RE = re.compile(r"^[ \t]*\[([^\]\n]+)\][ \t]+\[?([A-Za-z0-9_]+)\]?", re.MULTILINE)
+_SQL_SERVER_TABLE_END_RE = re.compile(r"^[ \t]*\)", re.MULTILINE)
+_SQL_SERVER_DATA_START_RE = re.compile(r"^(?:SET IDENTITY_INSERT|INSERT\b)", re.MULTILINE)
+_SQL_DUMP_READ_CHUNK = 1 << 20
+_SQL_DUMP_SCAN_OVERLAP = 64
 
 
 @dataclass(frozen=True)
@@ -95,44 +99,73 @@ def selected_sql_base_table_roles() -> tuple[SqlBaseTableRole, ...]:
 
 @lru_cache(maxsize=None)
 def sql_dump_table_names(sql_dump_path: str | Path) -> tuple[str, ...]:
-    path = _require_file(sql_dump_path)
-    tables: list[str] = []
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line in handle:
-            match = _SQL_SERVER_CREATE_TABLE_RE.search(line)
-            if match:
-                tables.append(match.group(1))
-                continue
-            if tables and line.startswith("SET IDENTITY_INSERT"):
-                break
-    return tuple(tables)
+    return tuple(match.group(1) for match in _SQL_SERVER_CREATE_TABLE_RE.finditer(_sql_dump_schema_text(sql_dump_path)))
 
 
 @lru_cache(maxsize=None)
 def sql_dump_table_columns(sql_dump_path: str | Path, table_name: str) -> tuple[SqlDumpColumn, ...]:
-    path = _require_file(sql_dump_path)
+    schema = _sql_dump_schema_text(sql_dump_path)
+    wanted = table_name.lower()
     columns: list[SqlDumpColumn] = []
-    in_target_table = False
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line in handle:
-            create_match = _SQL_SERVER_CREATE_TABLE_RE.search(line)
-            if create_match:
-                if in_target_table:
-                    break
-                in_target_table = create_match.group(1).lower() == table_name.lower()
-                continue
-            if not in_target_table:
-                continue
-            if line.lstrip().startswith(")"):
-                break
-            column_match = _SQL_SERVER_COLUMN_RE.match(line)
-            if column_match:
-                columns.append(SqlDumpColumn(name=column_match.group(1), sql_type=column_match.group(2)))
+    tables = list(_SQL_SERVER_CREATE_TABLE_RE.finditer(schema))
+    for position, create_match in enumerate(tables):
+        if create_match.group(1).lower() != wanted:
+            continue
+        # Column lines start after the CREATE TABLE line and stop at the closing parenthesis line.
+        body_start = schema.find("\n", create_match.end())
+        body_end = tables[position + 1].start() if position + 1 < len(tables) else len(schema)
+        if body_start == -1:
+            break
+        table_end = _SQL_SERVER_TABLE_END_RE.search(schema, body_start + 1, body_end)
+        if table_end is not None:
+            body_end = table_end.start()
+        columns = [
+            SqlDumpColumn(name=column_match.group(1), sql_type=column_match.group(2))
+            for column_match in _SQL_SERVER_COLUMN_RE.finditer(schema, body_start + 1, body_end)
+        ]
+        break
     if not columns:
         raise KeyError(f"SQL dump table not found or has no parsed columns: {table_name}")
     return tuple(columns)
 
 
+@lru_cache(maxsize=1)
+def _sql_dump_schema_text(sql_dump_path: str | Path) -> str:
+    """Return the dump's DDL: from the first CREATE TABLE up to the first data statement after it.
+
+    The dump is read in chunks and each chunk is scanned once (plus a short overlap for statements
+    split across chunks), so neither the preamble nor the INSERT data is kept.
+    """
+    path = _require_file(sql_dump_path)
+    parts: list[str] = []
+    kept = 0
+    carry = ""
+    with path.open("r", encoding="utf-8", errors="ignore") as handle:
+        while True:
+            chunk = handle.read(_SQL_DUMP_READ_CHUNK)
+            if not chunk:
+                return "".join(parts)
+            window = carry + chunk
+            if not parts:
+                first_table = _SQL_SERVER_CREATE_TABLE_RE.search(window)
+                if first_table is None:
+                    carry = window[-_SQL_DUMP_SCAN_OVERLAP:]
+                    continue
+                chunk = window = window[first_table.start() :]
+                carry = ""
+                search_from = first_table.end() - first_table.start()
+            else:
+                # The overlap was scanned with the previous chunk; starting one character in keeps ``^``
+                # anchored to real line starts while still catching a statement split across the chunks.
+                search_from = 1
+            data_start = _SQL_SERVER_DATA_START_RE.search(window, search_from)
+            if data_start is not None:
+                return ("".join(parts) + chunk)[: kept - len(carry) + data_start.start()]
+            parts.append(chunk)
+            kept += len(chunk)
+            carry = window[-_SQL_DUMP_SCAN_OVERLAP:]
+
+
 def sqlite_table_names(sqlite_path: str | Path) -> tuple[str, ...]:
     path = _require_file(sqlite_path)
     with sqlite3.connect(path) as connection:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import csv
+import heapq
 import json
 import math
 import re
 import sqlite3
+from array import array
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -106,7 +108,7 @@ FEATURES: tuple[str, ...] = (
 BODY_FEATURES: tuple[str, ...] = ("height_inches", "weight_pounds")
 _MODEL_PREFIX = "POSITION_STAT_NEIGHBOR_MODEL_"
 _SUGGESTIONS_FILE = "suggested_field_values.csv"
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NeighborFieldSuggestion:
     field_key: str
     value: int | str
@@ -129,6 +131,8 @@ class StatNeighborModel:
     suggestions_by_player_team_position: dict[tuple[str, str, str], dict[str, NeighborFieldSuggestion]]
     candidates_by_position: dict[str, tuple[dict[str, Any], ...]]
     scales_by_position: dict[str, dict[str, tuple[float, float]]]
+    field_groups_by_position: dict[str, tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]]
+    feature_columns_by_position: dict[str, dict[str, tuple[array, bytes]]]
 
     def suggestions_for(self, *, player_id: str, team: str, position: str) -> dict[str, NeighborFieldSuggestion]:
         team_key = (_clean_key(player_id), _clean_key(team), position.strip().upper())
@@ -151,14 +155,11 @@ class StatNeighborModel:
             return {}
         relpath = str(self.path.relative_to(_repo_root()))
         values: dict[str, NeighborFieldSuggestion] = {}
-        all_fields = sorted(set().union(*(set(candidate["fields"]) for candidate in candidates)))
-        fields_by_features: dict[tuple[str, ...], list[str]] = {}
-        for field_key in all_fields:
-            fields_by_features.setdefault(_features_for_field(field_key), []).append(field_key)
-        for section_features, field_keys in fields_by_features.items():
+        for section_features, field_keys in self.field_groups_by_position.get(pos, ()):
             neighbors = _nearest_neighbors(
                 target_features,
                 candidates,
+                self.feature_columns_by_position.get(pos, {}),
                 self.scales_by_position.get(pos, {}),
                 features=section_features,
                 k=5,
@@ -208,11 +209,13 @@ def select_positions_from_evidence(play_by_play: dict[str, Any], fallback_pos: o
 @lru_cache(maxsize=1)
 def load_latest_stat_neighbor_model() -> StatNeighborModel:
     model_dir = _latest_model_dir()
-    field_map = _field_key_map()
+    suggestion_rows = _suggestion_rows(model_dir)
+    candidate_field_rows = _candidate_field_rows(model_dir)
+    field_map = _field_key_map(suggestion_rows, candidate_field_rows)
     suggestions_by_team: dict[tuple[str, str, str], dict[str, NeighborFieldSuggestion]] = {}
     suggestions_by_player: dict[tuple[str, str], dict[str, NeighborFieldSuggestion]] = {}
     suggestion_relpath = str(model_dir.relative_to(_repo_root()))
-    for row in _suggestion_rows(model_dir):
+    for row in suggestion_rows:
         field_key = field_map.get((str(row.get("Type") or ""), str(row.get("Input Field") or "")))
         if not field_key:
             continue
@@ -235,7 +238,7 @@ def load_latest_stat_neighbor_model() -> StatNeighborModel:
         )
         suggestions_by_team.setdefault(key, {})[field_key] = suggestion
         suggestions_by_player.setdefault((key[0], key[2]), {})[field_key] = suggestion
-    candidates_by_position = _load_candidate_pool(model_dir, field_map)
+    candidates_by_position = _load_candidate_pool(model_dir, field_map, candidate_field_rows)
     scales_by_position = _scale_by_position(candidates_by_position)
     return StatNeighborModel(
         path=model_dir,
@@ -243,6 +246,8 @@ def load_latest_stat_neighbor_model() -> StatNeighborModel:
         suggestions_by_player_team_position=suggestions_by_team,
         candidates_by_position=candidates_by_position,
         scales_by_position=scales_by_position,
+        field_groups_by_position={pos: _field_groups(candidates) for pos, candidates in candidates_by_position.items()},
+        feature_columns_by_position={pos: _feature_columns(candidates) for pos, candidates in candidates_by_position.items()},
     )
 
 
@@ -321,12 +326,16 @@ def _candidate_field_rows(model_path: Path) -> list[dict[str, Any]]:
         return [dict(row) for row in connection.execute('SELECT * FROM candidate_fields')]
 
 
-def _load_candidate_pool(model_path: Path, field_map: dict[tuple[str, str], str]) -> dict[str, tuple[dict[str, Any], ...]]:
+def _load_candidate_pool(
+    model_path: Path,
+    field_map: dict[tuple[str, str], str],
+    candidate_field_rows: list[dict[str, Any]],
+) -> dict[str, tuple[dict[str, Any], ...]]:
     source_path = _candidate_source_path(model_path)
     if source_path is None or not _sqlite_has_table(source_path, "candidate_pool"):
         return {}
     fields_by_candidate: dict[tuple[str, str, str], dict[str, float]] = {}
-    for row in _candidate_field_rows(model_path):
+    for row in candidate_field_rows:
         field_key = field_map.get((str(row.get("field_type") or row.get("Type") or ""), str(row.get("input_field") or row.get("Input Field") or "")))
         value = _float(row.get("value"))
         if not field_key or value is None:
@@ -377,44 +386,65 @@ def _scale_by_position(candidates_by_position: dict[str, tuple[dict[str, Any], .
     return out
 
 
+def _field_groups(candidates: tuple[dict[str, Any], ...]) -> tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]:
+    all_fields = sorted(set().union(*(set(candidate["fields"]) for candidate in candidates)))
+    fields_by_features: dict[tuple[str, ...], list[str]] = {}
+    for field_key in all_fields:
+        fields_by_features.setdefault(_features_for_field(field_key), []).append(field_key)
+    return tuple((features, tuple(field_keys)) for features, field_keys in fields_by_features.items())
+
+
 def _nearest_neighbors(
     target_features: dict[str, float | None],
     candidates: tuple[dict[str, Any], ...],
+    columns: dict[str, tuple[array, bytes]],
     scales: dict[str, tuple[float, float]],
     *,
     features: tuple[str, ...] = FEATURES,
     k: int,
 ) -> list[dict[str, Any]]:
+    # Target values and scales are resolved once; candidates are read from packed per-feature
+    # columns, and the distance is the RMS of the scaled differences over shared features.
+    prepared: list[tuple[float, float, array, bytes]] = []
+    for feature in features:
+        target_value = target_features.get(feature)
+        column = columns.get(feature)
+        if target_value is None or column is None:
+            continue
+        values, present = column
+        scale = scales.get(feature, (0.0, 1.0))[1] or 1.0
+        prepared.append((float(target_value), scale, values, present))
     rows: list[dict[str, Any]] = []
-    for candidate in candidates:
-        dist, common = _distance(target_features, candidate["features"], scales, features=features)
-        if dist is None:
+    for position, candidate in enumerate(candidates):
+        parts = [((target_value - values[position]) / scale) ** 2 for target_value, scale, values, present in prepared if present[position]]
+        if not parts:
             continue
-        rows.append({"candidate": candidate, "distance": dist, "common_features": common})
-    rows.sort(key=lambda row: row["distance"])
-    return rows[:k]
+        rows.append({"candidate": candidate, "distance": math.sqrt(sum(parts) / len(parts)), "common_features": len(parts)})
+    return heapq.nsmallest(k, rows, key=lambda row: row["distance"])
 
 
-def _distance(
-    a: dict[str, float | None],
-    b: dict[str, float | None],
-    scales: dict[str, tuple[float, float]],
-    *,
-    features: tuple[str, ...] = FEATURES,
-) -> tuple[float | None, int]:
-    parts: list[float] = []
-    for feature in features:
-        av = a.get(feature)
-        bv = b.get(feature)
-        if av is None or bv is None:
-            continue
-        scale = scales.get(feature, (0.0, 1.0))[1] or 1.0
-        parts.append(((float(av) - float(bv)) / scale) ** 2)
-    if not parts:
-        return None, 0
-    return math.sqrt(sum(parts) / len(parts)), len(parts)
+def _feature_columns(candidates: tuple[dict[str, Any], ...]) -> dict[str, tuple[array, bytes]]:
+    """Pack each candidate feature into a float column plus a presence mask, in candidate order."""
+    columns: dict[str, tuple[array, bytes]] = {}
+    for feature in (*FEATURES, *BODY_FEATURES):
+        values = array("d", bytes(8 * len(candidates)))
+        present = bytearray(len(candidates))
+        for position, candidate in enumerate(candidates):
+            value = candidate["features"].get(feature)
+            if value is not None:
+                values[position] = float(value)
+                present[position] = 1
+        columns[feature] = (values, bytes(present))
+    return columns
 
 
+_THREE_ZONE_KEYS = frozenset({"CENTER3", "LEFT3", "RIGHT3", "3CENTER", "3LEFT", "3LEFTCENTER", "3RIGHT", "3RIGHTCENTER"})
+_MID_ZONE_KEYS = frozenset({"MIDRANGECENTER", "MIDRANGELEFT", "MIDRANGELEFTCENTER", "MIDRANGERIGHT", "MIDRANGERIGHTCENTER"})
+_CLOSE_ZONE_KEYS = frozenset({"CLOSELEFT", "CLOSEMIDDLE", "CLOSERIGHT", "UNDERBASKET"})
+
+
+# Each position's field grouping classifies the same field keys, so the substring rules run once per key.
+@lru_cache(maxsize=None)
 def _features_for_field(field_key: str) -> tuple[str, ...]:
     section, _sep, raw_name = field_key.partition("/")
     key = _identity(raw_name or field_key)
@@ -422,14 +452,11 @@ def _features_for_field(field_key: str) -> tuple[str, ...]:
     is_tendency = section_key == "TENDENCIES"
 
     # Availability / body / durability. These should not fall through to star-impact stats.
-    three_zone_keys = {"CENTER3", "LEFT3", "RIGHT3", "3CENTER", "3LEFT", "3LEFTCENTER", "3RIGHT", "3RIGHTCENTER"}
-    mid_zone_keys = {"MIDRANGECENTER", "MIDRANGELEFT", "MIDRANGELEFTCENTER", "MIDRANGERIGHT", "MIDRANGERIGHTCENTER"}
-    close_zone_keys = {"CLOSELEFT", "CLOSEMIDDLE", "CLOSERIGHT", "UNDERBASKET"}
-    if key in three_zone_keys:
+    if key in _THREE_ZONE_KEYS:
         return ("fg_percent_from_x3p_range", "corner_3_point_percent", "percent_corner_3s_of_3pa", "x3p_pct")
-    if key in mid_zone_keys:
+    if key in _MID_ZONE_KEYS:
         return ("fg_percent_from_x10_16_range", "fg_percent_from_x16_3p_range", "avg_dist_fga")
-    if key in close_zone_keys:
+    if key in _CLOSE_ZONE_KEYS:
         return ("fg_percent_from_x0_3_range", "fg_percent_from_x3_10_range", "percent_fga_from_x0_3_range")
     if "DURABILITY" in key:
         return ("games", "mp_per_game")
@@ -671,42 +698,52 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-@lru_cache(maxsize=1)
-def _field_key_map() -> dict[tuple[str, str], str]:
-    entries = _offset_entries()
+def _field_key_map(
+    suggestion_rows: list[dict[str, Any]],
+    candidate_field_rows: list[dict[str, Any]],
+) -> dict[tuple[str, str], str]:
     out: dict[tuple[str, str], str] = {}
-    model_path = _latest_model_dir()
     pairs = sorted(
-        {(str(row.get("Type") or ""), str(row.get("Input Field") or "")) for row in _suggestion_rows(model_path)}
-        | {(str(row.get("field_type") or ""), str(row.get("input_field") or "")) for row in _candidate_field_rows(model_path)}
+        {(str(row.get("Type") or ""), str(row.get("Input Field") or "")) for row in suggestion_rows}
+        | {(str(row.get("field_type") or ""), str(row.get("input_field") or "")) for row in candidate_field_rows}
     )
     for field_type, input_field in pairs:
         section = "Attributes" if field_type == "Attribute" else "Tendencies" if field_type == "Tendency" else ""
         if not section or "/" not in input_field:
             continue
         group_text, field_text = (part.strip() for part in input_field.split("/", 1))
-        match = _find_offset_entry(entries, section, group_text, field_text)
+        match = _find_offset_entry(section, group_text, field_text)
         if match:
             _section, _group, normalized, _display = match
             out[(field_type, input_field)] = f"{section}/{normalized}"
     return out
 
 
-def _find_offset_entry(entries: tuple[tuple[str, str, str, str], ...], section: str, group_text: str, field_text: str) -> tuple[str, str, str, str] | None:
+def _find_offset_entry(section: str, group_text: str, field_text: str) -> tuple[str, str, str, str] | None:
     wanted_group = _identity(group_text)
     wanted_field = _identity(field_text)
     wanted_field_singular = wanted_field.rstrip("S")
-    for entry in entries:
-        sec, group, normalized, display = entry
-        if sec != section or _identity(group) != wanted_group:
-            continue
-        identities = {_identity(normalized), _identity(display)}
-        if wanted_field in identities or wanted_field_singular in {value.rstrip("S") for value in identities}:
+    bucket = _offset_entry_index().get((section, wanted_group), ())
+    for entry, identities, singulars in bucket:
+        if wanted_field in identities or wanted_field_singular in singulars:
             return entry
-    return _manual_field_alias(section, wanted_group, wanted_field, entries)
+    return _manual_field_alias(section, wanted_group, wanted_field, bucket)
 
 
-def _manual_field_alias(section: str, group: str, field: str, entries: tuple[tuple[str, str, str, str], ...]) -> tuple[str, str, str, str] | None:
+@lru_cache(maxsize=1)
+def _offset_entry_index() -> dict[tuple[str, str], tuple[tuple[tuple[str, str, str, str], frozenset[str], frozenset[str]], ...]]:
+    # Bucket the loaded offset entries by (section, group identity) once, with their field
+    # identities precomputed, so each lookup only walks its own group in offset-file order.
+    buckets: dict[tuple[str, str], list[tuple[tuple[str, str, str, str], frozenset[str], frozenset[str]]]] = {}
+    for entry in _offset_entries():
+        section, group, normalized, display = entry
+        identities = frozenset((_identity(normalized), _identity(display)))
+        singulars = frozenset(value.rstrip("S") for value in identities)
+        buckets.setdefault((section, _identity(group)), []).append((entry, identities, singulars))
+    return {key: tuple(rows) for key, rows in buckets.items()}
+
+
+def _manual_field_alias(section: str, group: str, field: str, bucket: tuple[tuple[tuple[str, str, str, str], frozenset[str], frozenset[str]], ...]) -> tuple[str, str, str, str] | None:
     aliases = {
         ("Tendencies", "JUMPSHOOTING", "CONTESTEDJUMPERMID"): "CONTESTEDJUMPERMIDRANGE",
         ("Tendencies", "LAYUPSANDDUNKS", "PUTBACKDUNK"): "PUTBACK",
@@ -714,8 +751,8 @@ def _manual_field_alias(section: str, group: str, field: str, entries: tuple[tup
     normalized = aliases.get((section, group, field))
     if not normalized:
         return None
-    for entry in entries:
-        if entry[0] == section and _identity(entry[1]) == group and entry[2] == normalized:
+    for entry, _identities, _singulars in bucket:
+        if entry[2] == normalized:
             return entry
     return None
 
@@ -745,24 +782,29 @@ def _offset_entries() -> tuple[tuple[str, str, str, str], ...]:
     return tuple(entries)
 
 
-def _parse_listed_positions(value: object) -> tuple[str, ...]:
-    text = str(value or "").upper()
-    compact = re.sub(r"[^A-Z]+", "", text)
-    position_map = {
-        "G": ("PG", "SG"),
-        "GF": ("SG", "SF"),
-        "FG": ("SF", "SG"),
-        "F": ("SF", "PF"),
-        "FC": ("PF", "C"),
-        "CF": ("C", "PF"),
-    }
-    mapped = position_map.get(compact)
+_NON_LETTER_RE = re.compile(r"[^A-Z]+")
+_POSITION_TOKEN_RE = re.compile(r"\b(?:PG|SG|SF|PF|C)\b")
+_COMPACT_POSITION_MAP = {
+    "G": ("PG", "SG"),
+    "GF": ("SG", "SF"),
+    "FG": ("SF", "SG"),
+    "F": ("SF", "PF"),
+    "FC": ("PF", "C"),
+    "CF": ("C", "PF"),
+}
+
+
+@lru_cache(maxsize=512)
+def _listed_positions_text(text: str) -> tuple[str, ...]:
+    mapped = _COMPACT_POSITION_MAP.get(_NON_LETTER_RE.sub("", text))
     if mapped:
         return mapped
-    found = [pos for pos in POSITIONS if re.search(rf"\b{pos}\b", text)]
-    if found:
-        return tuple(dict.fromkeys(found))
-    return ()
+    found = set(_POSITION_TOKEN_RE.findall(text))
+    return tuple(pos for pos in POSITIONS if pos in found)
+
+
+def _parse_listed_positions(value: object) -> tuple[str, ...]:
+    return _listed_positions_text(str(value or "").upper())
 
 
 def _identity(value: object) -> str:
@@ -7,6 +7,7 @@ utilities isolated from UI concerns.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 # Rating scaling constants
@@ -90,48 +91,99 @@ WEIGHT_MAX_POUNDS = 350.0
 POUNDS_TO_KILOGRAMS = 0.45359237
 
 
+# Rating fields are at most a few bytes wide, so the proportional mapping is
+# tabulated per bit length on first use and conversions become an index.
+_RATING_LUT_MAX_BITS = 16
+_RAW_TO_RATING_LUTS: dict[int, tuple[int, ...]] = {}
+_RATING_TO_RAW_LUTS: dict[int, tuple[int, ...]] = {}
+_RATING_SPAN_TRUE = RATING_MAX_TRUE - RATING_MIN
+
+
+def _scale_round(value: int, numerator: int, denominator: int) -> int:
+    """Integer ``round(value * numerator / denominator)`` for non-negative operands.
+
+    Bit-length maxima are odd and the rating span is odd, so the rating maps never land exactly on a
+    half and rounding half up agrees with the float formulas' ``round``.
+    """
+    return (2 * value * numerator + denominator) // (2 * denominator)
+
+
 def convert_raw_to_rating(raw: int, length: int) -> int:
     """
     Convert a raw bitfield value into the 25-99 display rating scale using proportional mapping.
     """
-    try:
+    table = _RAW_TO_RATING_LUTS.get(length)
+    if table is None and type(length) is int and 0 < length <= _RATING_LUT_MAX_BITS:
         max_raw = (1 << length) - 1
-        if max_raw <= 0:
-            return RATING_MIN
-        rating_true = RATING_MIN + (raw / max_raw) * (RATING_MAX_TRUE - RATING_MIN)
-        if rating_true < RATING_MIN:
-            rating_true = RATING_MIN
-        elif rating_true > RATING_MAX_DISPLAY:
-            rating_true = RATING_MAX_DISPLAY
-        return int(round(rating_true))
+        table = _RAW_TO_RATING_LUTS[length] = tuple(
+            min(RATING_MIN + _scale_round(value, _RATING_SPAN_TRUE, max_raw), RATING_MAX_DISPLAY) for value in range(max_raw + 1)
+        )
+    if table is not None and type(raw) is int and 0 <= raw < len(table):
+        return table[raw]
+    return _raw_to_rating(raw, length)
+
+
+def _raw_to_rating(raw: int, length: int) -> int:
+    try:
+        return _raw_to_rating_impl(raw, length)
     except Exception:
         return RATING_MIN
 
 
+def _raw_to_rating_impl(raw: int, length: int) -> int:
+    # No exception handling here: table builds only pass validated ints, untrusted input goes through the wrapper.
+    max_raw = (1 << length) - 1
+    if max_raw <= 0:
+        return RATING_MIN
+    rating_true = RATING_MIN + (raw / max_raw) * (RATING_MAX_TRUE - RATING_MIN)
+    if rating_true < RATING_MIN:
+        rating_true = RATING_MIN
+    elif rating_true > RATING_MAX_DISPLAY:
+        rating_true = RATING_MAX_DISPLAY
+    return int(round(rating_true))
+
+
 def convert_rating_to_raw(rating: float, length: int) -> int:
     """
     Convert a 25-99 rating back into a raw bitfield value using proportional mapping.
     """
-    try:
+    table = _RATING_TO_RAW_LUTS.get(length)
+    if table is None and type(length) is int and 0 < length <= _RATING_LUT_MAX_BITS:
         max_raw = (1 << length) - 1
-        if max_raw <= 0:
-            return 0
-        r = float(rating)
-        if r < RATING_MIN:
-            r = RATING_MIN
-        elif r > RATING_MAX_DISPLAY:
-            r = RATING_MAX_DISPLAY
-        fraction = (r - RATING_MIN) / (RATING_MAX_TRUE - RATING_MIN)
-        if fraction < 0.0:
-            fraction = 0.0
-        elif fraction > 1.0:
-            fraction = 1.0
-        raw_val = round(fraction * max_raw)
-        return max(0, min(int(raw_val), max_raw))
+        table = _RATING_TO_RAW_LUTS[length] = tuple(
+            min(_scale_round(value - RATING_MIN, max_raw, _RATING_SPAN_TRUE), max_raw)
+            for value in range(RATING_MIN, RATING_MAX_DISPLAY + 1)
+        )
+    if table is not None and type(rating) in (int, float) and RATING_MIN <= rating <= RATING_MAX_DISPLAY and rating == int(rating):
+        return table[int(rating) - RATING_MIN]
+    return _rating_to_raw(rating, length)
+
+
+def _rating_to_raw(rating: float, length: int) -> int:
+    try:
+        return _rating_to_raw_impl(float(rating), length)
     except Exception:
         return 0
 
 
+def _rating_to_raw_impl(rating: float, length: int) -> int:
+    max_raw = (1 << length) - 1
+    if max_raw <= 0:
+        return 0
+    r = rating
+    if r < RATING_MIN:
+        r = RATING_MIN
+    elif r > RATING_MAX_DISPLAY:
+        r = RATING_MAX_DISPLAY
+    fraction = (r - RATING_MIN) / (RATING_MAX_TRUE - RATING_MIN)
+    if fraction < 0.0:
+        fraction = 0.0
+    elif fraction > 1.0:
+        fraction = 1.0
+    raw_val = round(fraction * max_raw)
+    return max(0, min(int(raw_val), max_raw))
+
+
 def convert_potential_to_raw(rating: float, length: int | None = None, minimum: float = 40.0, maximum: float = 99.0) -> int:
     """Convert Potential display ratings into raw values, bounded to the 40-99 display scale."""
     try:
@@ -165,16 +217,20 @@ def convert_raw_to_minmax_potential(raw: int, length: int, minimum: float = 0.0,
 
 def convert_raw_to_body_scale_display(raw: object, length: int = 0) -> int:
     """Convert body scale raw float storage into the 0-100 editor display scale."""
-    try:
-        value = float(str(raw))
-    except Exception:
-        value = 0.0
+    if type(raw) is float or type(raw) is int:
+        value = float(raw)
+    else:
+        try:
+            value = float(str(raw))
+        except Exception:
+            value = 0.0
     return convert_tendency_raw_to_rating(int(round(value * 50.0)), length)
 
 
 def convert_body_scale_display_to_raw(display_value: object, length: int = 0) -> float:
     """Convert body scale 0-100 display values into raw float storage."""
-    return convert_rating_to_tendency_raw(float(str(display_value)), length) / 50.0
+    value = float(display_value) if type(display_value) is float or type(display_value) is int else float(str(display_value))
+    return convert_rating_to_tendency_raw(value, length) / 50.0
 
 
 def convert_raw_to_injury_duration_days(raw: int, maximum_days: int = 450) -> int:
@@ -272,10 +328,13 @@ def format_height_inches(inches: int) -> str:
 
 def convert_tendency_raw_to_rating(raw: int, length: int) -> int:
     """Convert a raw bitfield value into a 0-100 tendency rating."""
-    try:
-        value = int(raw)
-    except Exception:
-        value = 0
+    if type(raw) is int:
+        value = raw
+    else:
+        try:
+            value = int(raw)
+        except Exception:
+            value = 0
     if value < 0:
         value = 0
     elif value > 100:
@@ -285,10 +344,15 @@ def convert_tendency_raw_to_rating(raw: int, length: int) -> int:
 
 def convert_rating_to_tendency_raw(rating: float, length: int) -> int:
     """Convert a 0-100 tendency rating into a raw bitfield value."""
-    try:
+    if type(rating) is int:
+        return 0 if rating < 0 else 100 if rating > 100 else rating
+    if type(rating) is float:
         r = float(rating)
-    except Exception:
-        r = 0.0
+    else:
+        try:
+            r = float(rating)
+        except Exception:
+            r = 0.0
     if r < 0.0:
         r = 0.0
     elif r > 100.0:
@@ -309,17 +373,27 @@ def player_numeric_bounds(category_name: str, field_name: str, length_bits: int)
     return 0, (1 << bits) - 1 if bits else 0
 
 
+@lru_cache(maxsize=4096)
+def _parse_int_text(value: str) -> int:
+    value = value.strip()
+    if not value:
+        return 0
+    base = 16 if value.lower().startswith("0x") else 10
+    try:
+        return int(value, base)
+    except ValueError:
+        return 0
+
+
 def to_int(value: Any) -> int:
     """Convert strings or numeric values to an integer, accepting hex strings."""
+    if type(value) is int:
+        return value
     if isinstance(value, str):
-        value = value.strip()
-        if not value:
-            return 0
-        base = 16 if value.lower().startswith("0x") else 10
-        try:
-            return int(value, base)
-        except ValueError:
-            return 0
+        # Offset configs repeat the same address literals across entries and reloads.
+        return _parse_int_text(str(value))
+    if value is None:
+        return 0
     try:
         return int(value)
     except (TypeError, ValueError):
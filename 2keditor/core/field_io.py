@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import struct
+from dataclasses import dataclass
 from typing import Any
 
 from nba2k_editor.core import offsets as offsets_mod
@@ -24,9 +25,12 @@ from nba2k_editor.core.conversions import (
     raw_height_to_inches,
     to_int,
 )
+from nba2k_editor.memory.record_block import RecordBlock
 from nba2k_editor.models.schema import _field_display_or_name, _field_identity
 
 
+_F32 = struct.Struct("<f")
+
 _IMPLEMENTATION_REQUIRED_FLAGS = {
     "from_address_dropdown",
     "offset2",
@@ -54,6 +58,25 @@ _FIXED_NUMERIC_TYPE_WIDTHS: dict[str, int] = {
 
 _PARENT_POINTER_TYPES = {"pointer", "address", "uint64", "ulonglong"}
 
+_INTEGER_IO_TYPES = frozenset(
+    {
+        "uint",
+        "number",
+        "integer",
+        "byte",
+        "ubyte",
+        "ushort",
+        "uint64",
+        "ulonglong",
+        "pointer",
+        "address",
+        "combo",
+        "dropdown",
+        "slider",
+        *_ADDRESS_DROPDOWN_TYPES,
+    }
+)
+
 _PLAYER_ZERO_TO_100_FIELD_IDS = {
     "MINPOTENTIAL",
     "MAXPOTENTIAL",
@@ -71,6 +94,55 @@ _PLAYER_ZERO_TO_100_FIELD_IDS = {
 }
 
 
+# Per-object caches keyed by id(); the object itself is kept alongside so a recycled
+# id never returns another payload's entry.
+_BIT_WINDOW_CACHE: dict[int, tuple[dict[str, Any], tuple[int, int, int, int, int]]] = {}
+_FIELD_ID_CACHE: dict[int, tuple[dict[str, Any], str, str]] = {}
+_REVERSE_OPTIONS_CACHE: dict[int, tuple[object, dict[str, int]]] = {}
+
+
+@dataclass(frozen=True)
+class _PayloadSpec:
+    """Canonical view of an authored payload's key aliases and type checks."""
+
+    type_key: str
+    offset: int | None
+    requires_deref: bool
+    deref_offset: int
+    readable: bool
+    implemented: bool
+    bitfield: bool
+    integer_io: bool
+    width: int | None
+    readonly: bool
+    has_parent: bool
+    shoe_dropdown: bool
+    display_lookup: bool
+
+
+_PAYLOAD_SPEC_CACHE: dict[int, tuple[dict[str, Any], _PayloadSpec]] = {}
+
+# Each cache pins the objects it keys, and every layout reload brings a fresh set of payloads, so
+# a cache is dropped wholesale once it outgrows one loaded layout set. The model also calls
+# clear_payload_caches() whenever it discards its own layout caches.
+_PAYLOAD_CACHE_LIMIT = 4096
+
+
+def _remember(cache: dict[Any, Any], key: Any, entry: Any) -> None:
+    if len(cache) >= _PAYLOAD_CACHE_LIMIT:
+        cache.clear()
+    cache[key] = entry
+
+
+def clear_payload_caches() -> None:
+    """Forget every per-payload entry derived from previously loaded layouts."""
+    _BIT_WINDOW_CACHE.clear()
+    _FIELD_ID_CACHE.clear()
+    _REVERSE_OPTIONS_CACHE.clear()
+    _PAYLOAD_SPEC_CACHE.clear()
+    _CONVERSION_PLAN_CACHE.clear()
+
+
 def _field_offset(payload: dict[str, Any]) -> int:
     if "address" not in payload:
         raise KeyError("authored payload is missing address")
@@ -146,13 +218,72 @@ def _numeric_width(payload: dict[str, Any]) -> int:
     raise KeyError("authored payload is missing length, bit_length, or byteLength")
 
 
-def _bit_window(payload: dict[str, Any]) -> tuple[int, int, int]:
+def _bit_window(payload: dict[str, Any]) -> tuple[int, int, int, int, int]:
+    cached = _BIT_WINDOW_CACHE.get(id(payload))
+    if cached is not None and cached[0] is payload:
+        return cached[1]
     bit_offset = to_int(payload.get("bit_offset")) or to_int(payload.get("startBit"))
     bit_length = offsets_mod._resolved_length_bits(payload)
     if bit_length <= 0:
         raise KeyError("authored bitfield payload is missing length, bit_length, or byteLength")
     width = _bits_to_bytes(bit_offset + bit_length)
-    return bit_offset, bit_length, width
+    sign_bit = 1 << (bit_length - 1) if _type_key(payload) == "int" else 0
+    window = (bit_offset, bit_length, width, (1 << bit_length) - 1, sign_bit)
+    _remember(_BIT_WINDOW_CACHE, id(payload), (payload, window))
+    return window
+
+
+def _payload_spec(payload: dict[str, Any]) -> _PayloadSpec:
+    cached = _PAYLOAD_SPEC_CACHE.get(id(payload))
+    if cached is not None and cached[0] is payload:
+        return cached[1]
+    type_key = _type_key(payload)
+    try:
+        offset: int | None = _field_offset(payload)
+    except KeyError:
+        offset = None
+    try:
+        width: int | None = _numeric_width(payload)
+    except KeyError:
+        width = None
+    spec = _PayloadSpec(
+        type_key=type_key,
+        offset=offset,
+        requires_deref=bool(payload.get("requiresDereference")),
+        deref_offset=to_int(payload.get("dereferenceAddress")),
+        readable=_readable_payload(payload),
+        implemented=_implemented_payload(payload),
+        bitfield=_uses_bitfield_io(payload),
+        integer_io=type_key in _INTEGER_IO_TYPES,
+        width=width,
+        readonly=bool(payload.get("readonly")),
+        has_parent=bool(payload.get("parent")),
+        shoe_dropdown=bool(payload.get("shoe_dropdown")),
+        display_lookup=(
+            type_key in _ADDRESS_DROPDOWN_TYPES
+            or bool(payload.get("team_dropdown"))
+            or bool(payload.get("team_address_dropdown"))
+            or bool(payload.get("shoe_dropdown"))
+        ),
+    )
+    _remember(_PAYLOAD_SPEC_CACHE, id(payload), (payload, spec))
+    return spec
+
+
+def _spec_offset(spec: _PayloadSpec) -> int:
+    if spec.offset is None:
+        raise KeyError("authored payload is missing address")
+    return spec.offset
+
+
+def _field_name_and_id(field: dict[str, Any]) -> tuple[str, str]:
+    cached = _FIELD_ID_CACHE.get(id(field))
+    if cached is not None and cached[0] is field:
+        return cached[1], cached[2]
+    field_name = _field_display_or_name(field)
+    field_id = _field_identity(field_name)
+    _remember(_FIELD_ID_CACHE, id(field), (field, field_name, field_id))
+    return field_name, field_id
 
 
 def _read_pointer_value(memory: Any, address: int) -> int:
@@ -167,34 +298,43 @@ def _read_pointer_value(memory: Any, address: int) -> int:
 def _field_address(memory: Any, record_addr: int, payload: dict[str, Any], *, parent_payload: dict[str, Any] | None = None) -> int:
     base_address = int(record_addr)
     if parent_payload is not None:
-        parent_address = base_address + _field_offset(parent_payload)
-        if _type_key(parent_payload) in _PARENT_POINTER_TYPES:
+        parent_spec = _payload_spec(parent_payload)
+        parent_address = base_address + _spec_offset(parent_spec)
+        if parent_spec.type_key in _PARENT_POINTER_TYPES:
             base_address = _read_pointer_value(memory, parent_address)
         else:
             base_address = parent_address
-    address = base_address + _field_offset(payload)
-    if bool(payload.get("requiresDereference")):
-        dereference_offset = to_int(payload.get("dereferenceAddress"))
+    spec = _payload_spec(payload)
+    offset = _spec_offset(spec)
+    address = base_address + offset
+    if spec.requires_deref:
+        dereference_offset = spec.deref_offset
         pointer_slot = base_address + dereference_offset if dereference_offset else address
         pointer = _read_pointer_value(memory, pointer_slot)
-        address = pointer + _field_offset(payload)
+        address = pointer + offset
     return address
 
 
 def _read_bitfield(memory: Any, address: int, payload: dict[str, Any]) -> int:
-    bit_offset, bit_length, width = _bit_window(payload)
-    raw_int = int.from_bytes(memory.read_bytes(address, width), "little")
-    mask = (1 << bit_length) - 1
-    value = (raw_int >> bit_offset) & mask
-    if _type_key(payload) == "int" and value >= (1 << (bit_length - 1)):
-        value -= 1 << bit_length
+    bit_offset, _bit_length, width, mask, sign_bit = _bit_window(payload)
+    # Staged record blocks patch their buffer in place instead of copying the word out.
+    if type(memory) is RecordBlock:
+        word = memory.read_uint(address, width)
+    else:
+        word = int.from_bytes(memory.read_bytes(address, width), "little")
+    value = (word >> bit_offset) & mask
+    if sign_bit and value >= sign_bit:
+        value -= sign_bit << 1
     return value
 
 
 def _write_bitfield(memory: Any, address: int, payload: dict[str, Any], value: Any) -> None:
-    bit_offset, bit_length, width = _bit_window(payload)
+    bit_offset, _bit_length, width, value_mask, _sign_bit = _bit_window(payload)
+    mask = value_mask << bit_offset
+    if type(memory) is RecordBlock:
+        memory.write_bits(address, width, mask, int(value) << bit_offset)
+        return
     raw_int = int.from_bytes(memory.read_bytes(address, width), "little")
-    mask = ((1 << bit_length) - 1) << bit_offset
     new_int = (raw_int & ~mask) | ((int(value) << bit_offset) & mask)
     memory.write_bytes(address, new_int.to_bytes(width, "little"))
 
@@ -210,23 +350,38 @@ def _uses_bitfield_io(payload: dict[str, Any]) -> bool:
 def _list_mapping_value(raw_value: Any, options: object) -> Any | None:
     if not isinstance(options, list):
         return None
-    try:
-        index = int(raw_value)
-    except Exception:
-        return None
+    if type(raw_value) is int:
+        index = raw_value
+    else:
+        try:
+            index = int(raw_value)
+        except Exception:
+            return None
     if 0 <= index < len(options):
         return options[index]
     return None
 
 
+def _reverse_options(options: list[Any] | dict[Any, Any]) -> dict[str, int]:
+    """Map option text back to its raw value; the first matching option wins."""
+    cached = _REVERSE_OPTIONS_CACHE.get(id(options))
+    if cached is not None and cached[0] is options:
+        return cached[1]
+    reverse: dict[str, int] = {}
+    if isinstance(options, dict):
+        for raw_key, display in options.items():
+            reverse.setdefault(str(display), to_int(raw_key))
+    else:
+        for index, option in enumerate(options):
+            reverse.setdefault(str(option), index)
+    _remember(_REVERSE_OPTIONS_CACHE, id(options), (options, reverse))
+    return reverse
+
+
 def _reverse_list_mapping(value: Any, options: object) -> int | None:
     if not isinstance(options, list):
         return None
-    text = str(value)
-    for index, option in enumerate(options):
-        if text == str(option):
-            return index
-    return None
+    return _reverse_options(options).get(str(value))
 
 
 def _mapped_display_value(payload: dict[str, Any], raw_value: Any) -> Any | None:
@@ -257,10 +412,7 @@ def _mapped_raw_value(payload: dict[str, Any], value: Any) -> Any | None:
         return mapped
     mapping = payload.get("value_mapping")
     if isinstance(mapping, dict):
-        text = str(value)
-        for raw_key, display in mapping.items():
-            if text == str(display):
-                return to_int(raw_key)
+        return _reverse_options(mapping).get(str(value))
     return None
 
 
@@ -269,89 +421,168 @@ def _id_prefixed_option(raw_id: int, label: str) -> str:
     return f"[{int(raw_id)}] {text}" if text else f"[{int(raw_id)}]"
 
 
+_KIND_RAW = 0
+_KIND_SEASON_YEAR = 1
+_KIND_YEAR = 2
+_KIND_HEIGHT = 3
+_KIND_DIV100 = 4
+_KIND_WEIGHT = 5
+_KIND_BODY_SCALE = 6
+_KIND_SCALE = 7
+_KIND_POTENTIAL = 8
+_KIND_ZERO_TO_100 = 9
+_KIND_INJURY_DAYS = 10
+_KIND_RATING = 11
+_KIND_TENDENCY = 12
+
+_SECTION_KINDS: dict[str, int] = {
+    "Attributes": _KIND_RATING,
+    "Durability": _KIND_RATING,
+    "Tendencies": _KIND_TENDENCY,
+}
+
+_CONVERSION_PLAN_CACHE: dict[tuple[int, int, str], tuple[dict[str, Any], dict[str, Any], tuple[str, bool, int, int, int]]] = {}
+
+
+def _conversion_plan(section: str, field: dict[str, Any], payload: dict[str, Any]) -> tuple[str, bool, int, int, int]:
+    """Return a field's (type key, has option mapping, display kind, raw kind, length bits).
+
+    Only WEIGHT has different display and raw kinds. Bulk imports and exports convert the same few
+    hundred fields per record, so everything that depends only on the payload is resolved once.
+    """
+    key = (id(payload), id(field), section)
+    cached = _CONVERSION_PLAN_CACHE.get(key)
+    if cached is not None and cached[0] is payload and cached[1] is field:
+        return cached[2]
+    field_name, field_id = _field_name_and_id(field)
+    if "season_year_base" in payload:
+        kind = _KIND_SEASON_YEAR
+    elif "year_map_base" in payload or is_year_offset_field(field_name):
+        kind = _KIND_YEAR
+    elif field_id in {"HEIGHT", "WINGSPAN"}:
+        kind = _KIND_HEIGHT
+    elif bool(payload.get("div100")):
+        kind = _KIND_DIV100
+    else:
+        kind = -1
+    if kind >= 0:
+        kinds = (kind, kind)
+    else:
+        if bool(payload.get("body_scale_0_100")) or bool(payload.get("body_scale_25_75")):
+            kind = _KIND_BODY_SCALE
+        elif "scale" in payload:
+            kind = _KIND_SCALE
+        elif field_id == "POTENTIAL":
+            kind = _KIND_POTENTIAL
+        elif field_id in _PLAYER_ZERO_TO_100_FIELD_IDS:
+            kind = _KIND_ZERO_TO_100
+        elif bool(payload.get("injury_duration_days")) or field_id in {"INJURY1DURATION", "INJURY2DURATION"}:
+            kind = _KIND_INJURY_DAYS
+        else:
+            kind = _SECTION_KINDS.get(section, _KIND_RAW)
+        kinds = (kind, _KIND_WEIGHT if field_id == "WEIGHT" else kind)
+    has_mapping = (
+        isinstance(payload.get("values"), list)
+        or isinstance(payload.get("dropdown"), list)
+        or isinstance(payload.get("value_mapping"), dict)
+    )
+    plan = (_type_key(payload), has_mapping, kinds[0], kinds[1], offsets_mod._resolved_length_bits(payload))
+    _remember(_CONVERSION_PLAN_CACHE, key, (payload, field, plan))
+    return plan
+
+
 def _raw_to_display_value(section: str, field: dict[str, Any], payload: dict[str, Any], raw_value: Any) -> Any:
-    type_key = _type_key(payload)
+    type_key, has_mapping, kind, _raw_kind, length_bits = _conversion_plan(section, field, payload)
     if type_key == "color" and isinstance(raw_value, (bytes, bytearray)):
         return _color_hex(bytes(raw_value))
     if type_key == "result_score" and isinstance(raw_value, tuple) and len(raw_value) == 2:
         return _format_result_score(raw_value)
-    mapped = _mapped_display_value(payload, raw_value)
-    if mapped is not None:
-        return mapped
-    field_name = _field_display_or_name(field)
-    field_id = _field_identity(field_name)
-    length_bits = offsets_mod._resolved_length_bits(payload)
-    if "season_year_base" in payload:
+    if has_mapping:
+        mapped = _mapped_display_value(payload, raw_value)
+        if mapped is not None:
+            return mapped
+    if kind == _KIND_RAW:
+        return raw_value
+    if kind == _KIND_SEASON_YEAR:
         start_year = to_int(payload.get("season_year_base")) + int(raw_value)
         if bool(payload.get("season_range")):
             return f"{start_year}-{start_year + 1}"
         return start_year
-    if "year_map_base" in payload or is_year_offset_field(field_name):
+    if kind == _KIND_YEAR:
         return convert_raw_to_year(int(raw_value), to_int(payload.get("year_map_base")) or 1900)
-    if field_id in {"HEIGHT", "WINGSPAN"}:
+    if kind == _KIND_HEIGHT:
         return raw_height_to_inches(int(raw_value))
-    if bool(payload.get("div100")):
+    if kind == _KIND_DIV100:
         return int(raw_value) / 100
-    if bool(payload.get("body_scale_0_100")) or bool(payload.get("body_scale_25_75")):
-        return convert_raw_to_body_scale_display(raw_value, length_bits)
-    if "scale" in payload:
+    if kind == _KIND_SCALE:
         return float(raw_value) * float(payload.get("scale") or 1)
-    if field_id == "POTENTIAL":
-        return convert_raw_to_potential(to_int(raw_value), length_bits)
-    if field_id in _PLAYER_ZERO_TO_100_FIELD_IDS:
-        return convert_tendency_raw_to_rating(to_int(raw_value), length_bits)
-    if bool(payload.get("injury_duration_days")) or field_id in {"INJURY1DURATION", "INJURY2DURATION"}:
+    if kind == _KIND_INJURY_DAYS:
         return convert_raw_to_injury_duration_days(to_int(raw_value))
-    if section in {"Attributes", "Durability"}:
+    if kind == _KIND_RATING:
         return convert_raw_to_rating(int(raw_value), length_bits)
-    if section == "Tendencies":
+    if kind == _KIND_TENDENCY:
         return convert_tendency_raw_to_rating(int(raw_value), length_bits)
+    if kind == _KIND_BODY_SCALE:
+        return convert_raw_to_body_scale_display(raw_value, length_bits)
+    if kind == _KIND_POTENTIAL:
+        return convert_raw_to_potential(to_int(raw_value), length_bits)
+    if kind == _KIND_ZERO_TO_100:
+        return convert_tendency_raw_to_rating(to_int(raw_value), length_bits)
     return raw_value
 
 
 def _display_to_raw_value(section: str, field: dict[str, Any], payload: dict[str, Any], value: Any) -> Any:
-    type_key = _type_key(payload)
+    type_key, has_mapping, _display_kind, kind, length_bits = _conversion_plan(section, field, payload)
     if type_key == "color":
         return _parse_color_value(value, _numeric_width(payload))
     if type_key == "result_score":
         return _parse_result_score(value)
-    mapped = _mapped_raw_value(payload, value)
-    if mapped is not None:
-        return mapped
-    field_name = _field_display_or_name(field)
-    field_id = _field_identity(field_name)
-    length_bits = offsets_mod._resolved_length_bits(payload)
-    if "season_year_base" in payload:
+    if has_mapping:
+        mapped = _mapped_raw_value(payload, value)
+        if mapped is not None:
+            return mapped
+    if kind == _KIND_RAW:
+        return value
+    if kind == _KIND_SEASON_YEAR:
         text = str(value)
         start_text = text.split("-", 1)[0].strip()
         return int(start_text) - to_int(payload.get("season_year_base"))
-    if "year_map_base" in payload or is_year_offset_field(field_name):
+    if kind == _KIND_YEAR:
         return convert_year_to_raw(int(value), to_int(payload.get("year_map_base")) or 1900)
-    if field_id in {"HEIGHT", "WINGSPAN"}:
+    if kind == _KIND_HEIGHT:
         return height_inches_to_raw(int(value))
-    if bool(payload.get("div100")):
+    if kind == _KIND_DIV100:
         return int(round(float(value) * 100))
-    if field_id == "WEIGHT":
+    if kind == _KIND_WEIGHT:
         normalized_weight = normalize_weight_value(value)
         return normalized_weight if normalized_weight is not None else value
-    if bool(payload.get("body_scale_0_100")) or bool(payload.get("body_scale_25_75")):
-        return convert_body_scale_display_to_raw(value, length_bits)
-    if "scale" in payload:
+    if kind == _KIND_SCALE:
         scale = float(payload.get("scale") or 1)
         return float(value) / scale if scale else value
-    if field_id == "POTENTIAL":
-        return convert_potential_to_raw(float(value), length_bits)
-    if field_id in _PLAYER_ZERO_TO_100_FIELD_IDS:
-        return convert_rating_to_tendency_raw(float(value), length_bits)
-    if bool(payload.get("injury_duration_days")) or field_id in {"INJURY1DURATION", "INJURY2DURATION"}:
+    if kind == _KIND_INJURY_DAYS:
         return convert_injury_duration_days_to_raw(float(value))
-    if section in {"Attributes", "Durability"}:
-        return convert_rating_to_raw(float(value), length_bits)
-    if section == "Tendencies":
-        return convert_rating_to_tendency_raw(float(value), length_bits)
+    if kind == _KIND_RATING:
+        return convert_rating_to_raw(_display_number(value), length_bits)
+    if kind == _KIND_TENDENCY:
+        return convert_rating_to_tendency_raw(_display_number(value), length_bits)
+    if kind == _KIND_BODY_SCALE:
+        return convert_body_scale_display_to_raw(value, length_bits)
+    if kind == _KIND_POTENTIAL:
+        return convert_potential_to_raw(float(value), length_bits)
+    if kind == _KIND_ZERO_TO_100:
+        return convert_rating_to_tendency_raw(_display_number(value), length_bits)
     return value
 
 
+def _display_number(value: Any) -> int | float:
+    # Whole-number ratings stay ints so the converters clamp or index a table instead of rounding floats.
+    if type(value) is int:
+        return value
+    if type(value) is str and value.isdigit():
+        return int(value)
+    return float(value)
+
+
 def _string_length(payload: dict[str, Any]) -> int:
     length = to_int(payload.get("length"))
     if length <= 0:
@@ -359,9 +590,9 @@ def _string_length(payload: dict[str, Any]) -> int:
     return length
 
 
-def _read_string(memory: Any, address: int, payload: dict[str, Any]) -> str:
+def _read_string(memory: Any, address: int, payload: dict[str, Any], type_key: str | None = None) -> str:
     max_chars = _string_length(payload)
-    if _type_key(payload) == "wstring":
+    if (type_key if type_key is not None else _type_key(payload)) == "wstring":
         return memory.read_wstring(address, max_chars)
     return memory.read_ascii(address, max_chars)
 
@@ -402,8 +633,8 @@ def _coerce_result_component(value: float) -> int | float:
 
 def _read_result_score(memory: Any, address: int, payload: dict[str, Any]) -> tuple[int | float, int | float]:
     first_address, second_address = _result_score_addresses(address, payload)
-    first = struct.unpack("<f", memory.read_bytes(first_address, 4))[0]
-    second = struct.unpack("<f", memory.read_bytes(second_address, 4))[0]
+    first = _F32.unpack(memory.read_bytes(first_address, 4))[0]
+    second = _F32.unpack(memory.read_bytes(second_address, 4))[0]
     return _coerce_result_component(first), _coerce_result_component(second)
 
 
@@ -447,37 +678,25 @@ def _parse_color_value(value: Any, width: int) -> bytes:
 
 
 def _read_authored_value(memory: Any, address: int, payload: dict[str, Any]) -> Any:
-    if not _readable_payload(payload):
+    spec = _payload_spec(payload)
+    if not spec.readable:
         raise NotImplementedError(f"authored type requires backend implementation: {payload.get('type')}")
-    type_key = _type_key(payload)
-    if _uses_bitfield_io(payload):
+    type_key = spec.type_key
+    if spec.bitfield:
         return _read_bitfield(memory, address, payload)
-    if type_key in {
-        "uint",
-        "number",
-        "integer",
-        "byte",
-        "ubyte",
-        "ushort",
-        "uint64",
-        "ulonglong",
-        "pointer",
-        "address",
-        "combo",
-        "dropdown",
-        "slider",
-        *_ADDRESS_DROPDOWN_TYPES,
-    }:
-        width = _numeric_width(payload)
+    if spec.integer_io:
+        width = spec.width or _numeric_width(payload)
         if width == 4:
             return memory.read_uint32(address)
         if width == 8:
             return memory.read_u64(address)
         return int.from_bytes(memory.read_bytes(address, width), "little")
     if type_key == "float":
-        return struct.unpack("<f", memory.read_bytes(address, 4))[0]
+        if type(memory) is RecordBlock:
+            return memory.read_float(address)
+        return _F32.unpack(memory.read_bytes(address, 4))[0]
     if type_key in {"string", "wstring"}:
-        return _read_string(memory, address, payload)
+        return _read_string(memory, address, payload, type_key)
     if type_key == "ptr_string":
         return _read_ptr_string(memory, address, payload)
     if type_key == "result_score":
@@ -490,41 +709,30 @@ def _read_authored_value(memory: Any, address: int, payload: dict[str, Any]) ->
 
 
 def _write_authored_value(memory: Any, address: int, payload: dict[str, Any], value: Any) -> None:
-    if not _implemented_payload(payload):
+    spec = _payload_spec(payload)
+    if not spec.implemented:
         raise NotImplementedError(f"authored type requires backend implementation: {payload.get('type')}")
-    type_key = _type_key(payload)
-    if _uses_bitfield_io(payload):
+    type_key = spec.type_key
+    if spec.bitfield:
         _write_bitfield(memory, address, payload, value)
-    elif type_key in {
-        "uint",
-        "number",
-        "integer",
-        "byte",
-        "ubyte",
-        "ushort",
-        "uint64",
-        "ulonglong",
-        "pointer",
-        "address",
-        "combo",
-        "dropdown",
-        "slider",
-        *_ADDRESS_DROPDOWN_TYPES,
-    }:
-        width = _numeric_width(payload)
+    elif spec.integer_io:
+        width = spec.width or _numeric_width(payload)
         if width == 4:
             memory.write_uint32(address, int(value))
         else:
             memory.write_bytes(address, int(value).to_bytes(width, "little"))
     elif type_key == "float":
-        memory.write_bytes(address, struct.pack("<f", float(value)))
+        if type(memory) is RecordBlock:
+            memory.write_float(address, float(value))
+        else:
+            memory.write_bytes(address, _F32.pack(float(value)))
     elif type_key in {"string", "wstring"}:
         _write_string(memory, address, payload, value)
     elif type_key == "result_score":
         first, second = _parse_result_score(value)
         first_address, second_address = _result_score_addresses(address, payload)
-        memory.write_bytes(first_address, struct.pack("<f", first))
-        memory.write_bytes(second_address, struct.pack("<f", second))
+        memory.write_bytes(first_address, _F32.pack(first))
+        memory.write_bytes(second_address, _F32.pack(second))
     elif type_key == "color":
         memory.write_bytes(address, _parse_color_value(value, _numeric_width(payload)))
     elif type_key in {"binary", "hex_bytes"}:
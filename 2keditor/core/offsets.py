@@ -10,11 +10,17 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from importlib import resources
 from typing import Any, cast
 
 from .conversions import to_int
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 MODULE_NAME = "NBA2K26.exe"
 HOOK_TARGET_LABELS: dict[str, str] = {
     "nba2k26.exe": "NBA 2K26",
@@ -50,6 +56,8 @@ BASE_POINTER_SIZE_KEY_MAP: dict[str, str | None] = {
 _OFFSETS_RESOURCE_ROOT = resources.files("nba2k_editor.core") / "Offsets"
 _LEAGUE_OFFSETS_FILE = "offsets_league.json"
 _DROPDOWNS_FILE = "dropdowns.json"
+_DROPDOWN_OPTION_KEYS = ("dropdown", "values")
+_DROPDOWNS_CACHE: dict[str, object] | None = None
 _SUPER_TYPE_OFFSETS_FILES: dict[str, str] = {
     "Players": "offsets_players.json",
     "Draft Class": "offsets_players.json",
@@ -253,6 +261,7 @@ TEND_IMPORT_ORDER = [
 ]
 
 
+@lru_cache(maxsize=1024)
 def _split_version_tokens(raw_key: object) -> tuple[str, ...]:
     text = str(raw_key or "").strip()
     if not text:
@@ -261,6 +270,12 @@ def _split_version_tokens(raw_key: object) -> tuple[str, ...]:
     return tuple(dict.fromkeys(tokens))
 
 
+@lru_cache(maxsize=1024)
+def _version_token_set(raw_key: object) -> frozenset[str]:
+    return frozenset(_split_version_tokens(raw_key))
+
+
+@lru_cache(maxsize=1024)
 def _version_key_matches(raw_key: object, target_label: str | None) -> bool:
     target = str(target_label or "").strip().upper()
     if not target:
@@ -304,7 +319,7 @@ def get_editor_layout_for_super(super_type: str) -> dict[str, object]:
     layout_super = "Players" if target_super == "Draft Class" else target_super
     raw_domain = _load_offsets_resource(source_file)
     layout = cast(dict[str, object], raw_domain[layout_super])
-    dropdowns = _load_offsets_resource(_DROPDOWNS_FILE).get(layout_super)
+    dropdowns = _load_dropdowns_resource().get(layout_super)
     if not isinstance(dropdowns, dict):
         return layout
     for section, dropdown_groups in dropdowns.items():
@@ -330,27 +345,55 @@ def get_editor_layout_for_super(super_type: str) -> dict[str, object]:
                 dropdown_versions = dropdown_entry.get("versions")
                 if not isinstance(layout_versions, dict) or not isinstance(dropdown_versions, dict):
                     continue
+                # Version tokens are per layout entry, not per dropdown version; split them once.
+                layout_targets: list[tuple[dict, frozenset[str]]] = []
+                for layout_version_key, layout_payload in layout_versions.items():
+                    if not isinstance(layout_payload, dict):
+                        continue
+                    layout_tokens = _version_token_set(layout_version_key)
+                    if layout_tokens:
+                        layout_targets.append((layout_payload, layout_tokens))
+                if not layout_targets:
+                    continue
                 for dropdown_version_key, dropdown_payload in dropdown_versions.items():
                     if not isinstance(dropdown_payload, dict):
                         continue
-                    dropdown_tokens = set(_split_version_tokens(dropdown_version_key))
-                    for layout_version_key, layout_payload in layout_versions.items():
-                        if not isinstance(layout_payload, dict):
-                            continue
-                        layout_tokens = set(_split_version_tokens(layout_version_key))
-                        if not dropdown_tokens or not layout_tokens or not dropdown_tokens.intersection(layout_tokens):
+                    dropdown_tokens = _version_token_set(dropdown_version_key)
+                    if not dropdown_tokens:
+                        continue
+                    option_items = [
+                        (option_key, dropdown_payload[option_key])
+                        for option_key in _DROPDOWN_OPTION_KEYS
+                        if option_key in dropdown_payload
+                    ]
+                    if not option_items:
+                        continue
+                    for layout_payload, layout_tokens in layout_targets:
+                        if dropdown_tokens.isdisjoint(layout_tokens):
                             continue
-                        for option_key in ("dropdown", "values"):
-                            if option_key in dropdown_payload:
-                                layout_payload[option_key] = dropdown_payload[option_key]
+                        for option_key, options in option_items:
+                            layout_payload[option_key] = list(options) if isinstance(options, list) else options
     return layout
 
 
 def _load_offsets_resource(file_name: str) -> dict[str, object]:
-    raw = json.loads((_OFFSETS_RESOURCE_ROOT / file_name).read_text(encoding="utf-8"))
+    resource = _OFFSETS_RESOURCE_ROOT / file_name
+    if orjson is not None:
+        raw = orjson.loads(resource.read_bytes())
+    else:
+        raw = json.loads(resource.read_text(encoding="utf-8"))
     return dict(cast(dict[str, object], raw))
 
 
+def _load_dropdowns_resource() -> dict[str, object]:
+    # Every super type merges from the same dropdowns file; parse it once and hand each layout
+    # its own option lists so the shared copy is never mutated through a layout.
+    global _DROPDOWNS_CACHE
+    if _DROPDOWNS_CACHE is None:
+        _DROPDOWNS_CACHE = _load_offsets_resource(_DROPDOWNS_FILE)
+    return _DROPDOWNS_CACHE
+
+
 def _load_league_offset_config(target_executable: str | None = None) -> dict[str, object]:
     """Load the authored league offsets resource only."""
     target_exec = str(target_executable or MODULE_NAME or "").strip()
@@ -380,6 +423,7 @@ def get_active_offset_config(target_executable: str | None = None) -> dict[str,
     return cast(dict[str, object], data)
 
 
+@lru_cache(maxsize=64)
 def _derive_version_label(executable: str | None) -> str:
     exe = str(executable or MODULE_NAME).strip().lower()
     mapped = HOOK_TARGET_LABELS.get(exe)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import sys
 from pathlib import Path
 from typing import Any, Iterable
 
@@ -36,7 +37,7 @@ from .progression import (
     snapshot_from_storage_payload,
     snapshot_to_storage_payload,
 )
-from .timeline import default_stop_points
+from .timeline import default_stop_points, season_label
 from .world import DraftPickAsset, FranchisePlayer, InjuryStatus, PlayerContract, TeamContext, build_team_context
 
 _SCHEMA = """
@@ -274,8 +275,6 @@ class FranchiseStore:
         self.set_meta_value("current_season", season)
 
     def ensure_season(self, season: int) -> None:
-        from .timeline import season_label
-
         self._conn.execute(
             "INSERT OR IGNORE INTO seasons(season, label, current_phase) VALUES (?, ?, ?)",
             (season, season_label(season), SeasonPhase.PRESEASON.value),
@@ -735,10 +734,16 @@ def _player_payload(player: FranchisePlayer | dict[str, Any]) -> dict[str, Any]:
     return _drop_none(dict(player))
 
 
+def _shared_text(value: Any) -> str:
+    # Rows are decoded one JSON payload at a time, so every player would otherwise carry its own copy of
+    # the same few team ids and positions; interning shares them and makes later comparisons identity hits.
+    return sys.intern(str(value))
+
+
 def _player_from_payload(payload: dict[str, Any]) -> FranchisePlayer:
     return FranchisePlayer(
         player_id=str(payload.get("player_id") or payload.get("id") or ""),
-        team_id=str(payload.get("team_id") or payload.get("team") or ""),
+        team_id=_shared_text(payload.get("team_id") or payload.get("team") or ""),
         name=str(payload.get("name") or payload.get("player") or payload.get("player_id") or ""),
         age=_optional_float(payload.get("age")),
         overall=_optional_float(payload.get("overall", payload.get("ovr"))),
@@ -746,7 +751,7 @@ def _player_from_payload(payload: dict[str, Any]) -> FranchisePlayer:
         minutes=_optional_float(payload.get("minutes", payload.get("mpg"))),
         morale=_optional_float(payload.get("morale")),
         development=_optional_float(payload.get("development", payload.get("development_score"))),
-        position=str(payload.get("position") or payload.get("pos") or ""),
+        position=_shared_text(payload.get("position") or payload.get("pos") or ""),
         raw=dict(payload),
     )
 
@@ -771,7 +776,7 @@ def _contract_from_payload(payload: dict[str, Any]) -> PlayerContract:
     years = _int_value(payload.get("years_remaining", payload.get("years")), 0)
     return PlayerContract(
         player_id=str(payload.get("player_id") or payload.get("id") or ""),
-        team_id=str(payload.get("team_id") or payload.get("team") or ""),
+        team_id=_shared_text(payload.get("team_id") or payload.get("team") or ""),
         salary=_int_value(payload.get("salary", payload.get("current_salary")), 0),
         years_remaining=years,
         expiring=bool(payload.get("expiring")) or years == 1,
@@ -798,7 +803,7 @@ def _draft_pick_payload(pick: DraftPickAsset | dict[str, Any]) -> dict[str, Any]
 
 def _draft_pick_from_payload(payload: dict[str, Any]) -> DraftPickAsset:
     return DraftPickAsset(
-        team_id=str(payload.get("team_id") or payload.get("owner_team") or payload.get("team") or ""),
+        team_id=_shared_text(payload.get("team_id") or payload.get("owner_team") or payload.get("team") or ""),
         year=_int_value(payload.get("year", payload.get("season")), 0),
         round=_int_value(payload.get("round", payload.get("draft_round")), 1),
         protection=str(payload.get("protection") or payload.get("protections") or ""),
@@ -827,7 +832,7 @@ def _injury_payload(injury: InjuryStatus | dict[str, Any]) -> dict[str, Any]:
 def _injury_from_payload(payload: dict[str, Any]) -> InjuryStatus:
     return InjuryStatus(
         player_id=str(payload.get("player_id") or payload.get("id") or ""),
-        team_id=str(payload.get("team_id") or payload.get("team") or ""),
+        team_id=_shared_text(payload.get("team_id") or payload.get("team") or ""),
         severity=_int_value(payload.get("severity", payload.get("injury_severity")), 0),
         games_remaining=_int_value(payload.get("games_remaining", payload.get("games_out")), 0),
         description=str(payload.get("description") or payload.get("injury") or ""),
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import ctypes
-import struct
 import sys
+import threading
 from ctypes import wintypes
+from typing import Sequence
+
+try:
+    import psutil  # type: ignore
+except ImportError:
+    psutil = None  # type: ignore[assignment]
 
 MODULE_NAME = "NBA2K26.exe"
 HOOK_TARGETS: tuple[tuple[str, str], ...] = (
@@ -13,17 +19,28 @@ HOOK_TARGETS: tuple[tuple[str, str], ...] = (
     ("NBA 2K23", "NBA2K23.exe"),
     ("NBA 2K22", "NBA2K22.exe"),
 )
+# read_many merges ranges separated by less than a page, up to this many bytes per process read.
+READ_MANY_MAX_GAP = 0x1000
+READ_MANY_MAX_SPAN = 0x100000
+# read_bytes reuses a per-thread scratch buffer for reads up to this size.
+READ_SCRATCH_MAX = 0x1000
 
 from .win32 import (
     PROCESS_ALL_ACCESS,
+    STILL_ACTIVE,
     TH32CS_SNAPMODULE,
     TH32CS_SNAPMODULE32,
+    TH32CS_SNAPPROCESS,
     CreateToolhelp32Snapshot,
     Module32FirstW,
     Module32NextW,
     MODULEENTRY32W,
+    PROCESSENTRY32W,
+    Process32FirstW,
+    Process32NextW,
     OpenProcess,
     CloseHandle,
+    GetExitCodeProcess,
     ReadProcessMemory,
     WriteProcessMemory,
 )
@@ -38,6 +55,7 @@ class GameMemory:
         self.hproc: wintypes.HANDLE | None = None
         self.base_addr: int | None = None
         self.pointer_size = ctypes.sizeof(ctypes.c_void_p)
+        self._scratch = threading.local()
 
     def _detect_pointer_size(self, handle: wintypes.HANDLE | None) -> int:
         default = ctypes.sizeof(ctypes.c_void_p)
@@ -92,9 +110,9 @@ class GameMemory:
                 candidates.append(exe)
         if not candidates:
             return None
+        if psutil is None:
+            return None
         try:
-            import psutil  # type: ignore
-
             running = {
                 proc.info.get("name")
                 for proc in psutil.process_iter(["name"])
@@ -109,9 +127,14 @@ class GameMemory:
 
     def find_pid(self) -> int | None:
         target_name = self.module_name or MODULE_NAME
+        # An open handle keeps its pid from being reused, so a live attached process needs no scan.
+        if self.pid is not None and self.hproc and self._process_alive(self.hproc):
+            return self.pid
+        if sys.platform == "win32":
+            return self._find_pid_toolhelp(target_name)
+        if psutil is None:
+            return None
         try:
-            import psutil  # type: ignore
-
             for proc in psutil.process_iter(["name"]):
                 name = proc.info.get("name") if isinstance(proc.info, dict) else None
                 if name == target_name:
@@ -120,6 +143,30 @@ class GameMemory:
             pass
         return None
 
+    @staticmethod
+    def _process_alive(handle: wintypes.HANDLE) -> bool:
+        exit_code = wintypes.DWORD()
+        if not GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return False
+        return exit_code.value == STILL_ACTIVE
+
+    @staticmethod
+    def _find_pid_toolhelp(target_name: str) -> int | None:
+        snap = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if not snap or snap == wintypes.HANDLE(-1).value:
+            return None
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            ok = Process32FirstW(snap, ctypes.byref(entry))
+            while ok:
+                if entry.szExeFile == target_name:
+                    return int(entry.th32ProcessID)
+                ok = Process32NextW(snap, ctypes.byref(entry))
+        finally:
+            CloseHandle(snap)
+        return None
+
     def open_process(self) -> bool:
         """Open the game process and resolve its base address."""
         if sys.platform != "win32":
@@ -190,7 +237,7 @@ class GameMemory:
     def read_bytes(self, addr: int, length: int) -> bytes:
         """Read length bytes from absolute address addr."""
         self._check_open()
-        buf = (ctypes.c_ubyte * length)()
+        buf = self._scratch_buffer(length) if length <= READ_SCRATCH_MAX else (ctypes.c_char * length)()
         read_count = ctypes.c_size_t()
         ok = ReadProcessMemory(self.hproc, ctypes.c_void_p(addr), buf, length, ctypes.byref(read_count))
         if not ok:
@@ -198,7 +245,18 @@ class GameMemory:
             raise RuntimeError(f"Failed to read memory at 0x{addr:X} (error {winerr})")
         if read_count.value != length:
             raise RuntimeError(f"Partial read at 0x{addr:X}: {read_count.value}/{length} bytes")
-        return bytes(buf)
+        return buf.raw
+
+    def _scratch_buffer(self, length: int) -> ctypes.Array[ctypes.c_char]:
+        """Return this thread's reusable read buffer of exactly length bytes."""
+        try:
+            buffers = self._scratch.buffers
+        except AttributeError:
+            buffers = self._scratch.buffers = {}
+        buf = buffers.get(length)
+        if buf is None:
+            buf = buffers[length] = (ctypes.c_char * length)()
+        return buf
 
     def write_bytes(self, addr: int, data: bytes) -> None:
         """Write data to absolute address addr."""
@@ -213,17 +271,92 @@ class GameMemory:
         if written.value != length:
             raise RuntimeError(f"Partial write at 0x{addr:X}: {written.value}/{length} bytes")
 
+    def read_many(self, ranges: Sequence[tuple[int, int]]) -> list[bytes | None]:
+        """Read several ``(addr, length)`` ranges, merging nearby ones into a single process read.
+
+        Results follow the input order. A merged read that fails is retried range by range, and a
+        range that still cannot be read yields ``None`` instead of failing the whole batch.
+        """
+        self._check_open()
+        results: list[bytes | None] = [None] * len(ranges)
+        order = sorted(range(len(ranges)), key=lambda position: ranges[position][0])
+        group: list[int] = []
+        span_start = span_end = 0
+        for position in order:
+            start, length = ranges[position]
+            end = start + length
+            if group and start - span_end <= READ_MANY_MAX_GAP and max(end, span_end) - span_start <= READ_MANY_MAX_SPAN:
+                group.append(position)
+                span_end = max(span_end, end)
+                continue
+            if group:
+                self._read_group(ranges, group, span_start, span_end, results)
+            group = [position]
+            span_start, span_end = start, end
+        if group:
+            self._read_group(ranges, group, span_start, span_end, results)
+        return results
+
+    def _read_group(
+        self,
+        ranges: Sequence[tuple[int, int]],
+        group: list[int],
+        span_start: int,
+        span_end: int,
+        results: list[bytes | None],
+    ) -> None:
+        if len(group) > 1:
+            span = bytearray(span_end - span_start)
+            buf = (ctypes.c_ubyte * len(span)).from_buffer(span)
+            read_count = ctypes.c_size_t()
+            ok = ReadProcessMemory(self.hproc, ctypes.c_void_p(span_start), buf, len(span), ctypes.byref(read_count))
+            del buf
+            if ok and read_count.value == len(span):
+                view = memoryview(span)
+                for position in group:
+                    start, length = ranges[position]
+                    results[position] = bytes(view[start - span_start : start - span_start + length])
+                return
+        for position in group:
+            start, length = ranges[position]
+            try:
+                results[position] = self.read_bytes(start, length)
+            except RuntimeError:
+                results[position] = None
+
+    def _read_scalar(self, addr: int, value: ctypes.c_uint32 | ctypes.c_uint64) -> int:
+        """Read a little-endian integer straight into a ctypes scalar (no byte copy or unpack)."""
+        self._check_open()
+        length = ctypes.sizeof(value)
+        read_count = ctypes.c_size_t()
+        ok = ReadProcessMemory(self.hproc, ctypes.c_void_p(addr), ctypes.byref(value), length, ctypes.byref(read_count))
+        if not ok:
+            winerr = ctypes.get_last_error()
+            raise RuntimeError(f"Failed to read memory at 0x{addr:X} (error {winerr})")
+        if read_count.value != length:
+            raise RuntimeError(f"Partial read at 0x{addr:X}: {read_count.value}/{length} bytes")
+        return value.value
+
+    def _write_scalar(self, addr: int, value: ctypes.c_uint32 | ctypes.c_uint64) -> None:
+        """Write a little-endian integer straight from a ctypes scalar (no pack or buffer copy)."""
+        self._check_open()
+        length = ctypes.sizeof(value)
+        written = ctypes.c_size_t()
+        ok = WriteProcessMemory(self.hproc, ctypes.c_void_p(addr), ctypes.byref(value), length, ctypes.byref(written))
+        if not ok:
+            winerr = ctypes.get_last_error()
+            raise RuntimeError(f"Failed to write memory at 0x{addr:X} (error {winerr})")
+        if written.value != length:
+            raise RuntimeError(f"Partial write at 0x{addr:X}: {written.value}/{length} bytes")
+
     def read_uint32(self, addr: int) -> int:
-        data = self.read_bytes(addr, 4)
-        return struct.unpack("<I", data)[0]
+        return self._read_scalar(addr, ctypes.c_uint32())
 
     def write_uint32(self, addr: int, value: int) -> None:
-        data = struct.pack("<I", value & 0xFFFFFFFF)
-        self.write_bytes(addr, data)
+        self._write_scalar(addr, ctypes.c_uint32(value & 0xFFFFFFFF))
 
     def read_u64(self, addr: int) -> int:
-        data = self.read_bytes(addr, 8)
-        return struct.unpack("<Q", data)[0]
+        return self._read_scalar(addr, ctypes.c_uint64())
 
     def read_wstring(self, addr: int, max_chars: int) -> str:
         """Read a UTF-16LE string of at most max_chars characters from addr."""
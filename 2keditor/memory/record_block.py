@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import struct
+from typing import Any, Sequence
+
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_F32 = struct.Struct("<f")
+
+
+class RecordBlock:
+    """Prefetched copy of one record window that serves reads without extra process reads.
+
+    Reads that fall inside the window are sliced from the local copy; anything outside
+    (dereferenced pointers, parent records) falls through to the wrapped memory object.
+    With ``deferred=True`` in-window writes only patch the local copy and ``flush()``
+    writes the touched span back in one call.
+    """
+
+    def __init__(self, memory: Any, start: int, data: bytes, *, deferred: bool = False) -> None:
+        self.memory = memory
+        self.start = int(start)
+        self.data = bytearray(data)
+        self.end = self.start + len(self.data)
+        self.deferred = deferred
+        self._dirty_start: int | None = None
+        self._dirty_end = 0
+
+    @classmethod
+    def read(cls, memory: Any, start: int, length: int, *, deferred: bool = False) -> "RecordBlock":
+        return cls(memory, start, memory.read_bytes(start, length), deferred=deferred)
+
+    @classmethod
+    def read_many(
+        cls,
+        memory: Any,
+        spans: Sequence[tuple[int, int]],
+        *,
+        deferred: bool = False,
+    ) -> list["RecordBlock | None"]:
+        """Read one block per ``(start, length)`` span; unreadable spans come back as ``None``.
+
+        Backends with ``read_many`` get the whole batch so they can merge nearby spans.
+        """
+        reader = getattr(memory, "read_many", None)
+        if callable(reader):
+            try:
+                datas = reader(spans)
+            except Exception:
+                datas = [None] * len(spans)
+        else:
+            datas = []
+            for start, length in spans:
+                try:
+                    datas.append(memory.read_bytes(start, length))
+                except Exception:
+                    datas.append(None)
+        return [
+            None if data is None else cls(memory, start, data, deferred=deferred)
+            for (start, _length), data in zip(spans, datas)
+        ]
+
+    @property
+    def pointer_size(self) -> int:
+        return self.memory.pointer_size
+
+    @property
+    def hproc(self) -> Any:
+        return self.memory.hproc
+
+    @property
+    def base_addr(self) -> int | None:
+        return self.memory.base_addr
+
+    def contains(self, addr: int, length: int) -> bool:
+        return self.start <= addr and addr + length <= self.end
+
+    def read_bytes(self, addr: int, length: int) -> bytes:
+        offset = addr - self.start
+        if 0 <= offset and addr + length <= self.end:
+            return bytes(memoryview(self.data)[offset : offset + length])
+        return self.memory.read_bytes(addr, length)
+
+    def write_bytes(self, addr: int, data: bytes) -> None:
+        length = len(data)
+        if not self.contains(addr, length):
+            self.memory.write_bytes(addr, data)
+            return
+        offset = addr - self.start
+        self.data[offset : offset + length] = data
+        if not self.deferred:
+            self.memory.write_bytes(addr, data)
+            return
+        self._dirty_start = offset if self._dirty_start is None else min(self._dirty_start, offset)
+        self._dirty_end = max(self._dirty_end, offset + length)
+
+    def flush(self) -> bool:
+        """Write the span touched by deferred writes; return whether anything was written."""
+        if self._dirty_start is None:
+            return False
+        start, end = self._dirty_start, self._dirty_end
+        self._dirty_start = None
+        self._dirty_end = 0
+        self.memory.write_bytes(self.start + start, bytes(self.data[start:end]))
+        return True
+
+    def read_uint(self, addr: int, width: int) -> int:
+        offset = addr - self.start
+        if 0 <= offset and addr + width <= self.end:
+            return int.from_bytes(self.data[offset : offset + width], "little")
+        return int.from_bytes(self.memory.read_bytes(addr, width), "little")
+
+    def write_bits(self, addr: int, width: int, mask: int, bits: int) -> None:
+        """Replace the ``mask`` bits of the little-endian ``width``-byte word at ``addr`` with ``bits``."""
+        offset = addr - self.start
+        if not (self.deferred and 0 <= offset and addr + width <= self.end):
+            word = (self.read_uint(addr, width) & ~mask) | (bits & mask)
+            self.write_bytes(addr, word.to_bytes(width, "little"))
+            return
+        end = offset + width
+        data = self.data
+        word = (int.from_bytes(data[offset:end], "little") & ~mask) | (bits & mask)
+        data[offset:end] = word.to_bytes(width, "little")
+        if self._dirty_start is None or offset < self._dirty_start:
+            self._dirty_start = offset
+        if end > self._dirty_end:
+            self._dirty_end = end
+
+    def read_uint32(self, addr: int) -> int:
+        offset = addr - self.start
+        if 0 <= offset and addr + 4 <= self.end:
+            return _U32.unpack_from(self.data, offset)[0]
+        return _U32.unpack(self.memory.read_bytes(addr, 4))[0]
+
+    def write_uint32(self, addr: int, value: int) -> None:
+        offset = addr - self.start
+        if not (self.deferred and 0 <= offset and addr + 4 <= self.end):
+            self.write_bytes(addr, _U32.pack(value & 0xFFFFFFFF))
+            return
+        _U32.pack_into(self.data, offset, value & 0xFFFFFFFF)
+        if self._dirty_start is None or offset < self._dirty_start:
+            self._dirty_start = offset
+        if offset + 4 > self._dirty_end:
+            self._dirty_end = offset + 4
+
+    def read_u64(self, addr: int) -> int:
+        offset = addr - self.start
+        if 0 <= offset and addr + 8 <= self.end:
+            return _U64.unpack_from(self.data, offset)[0]
+        return _U64.unpack(self.memory.read_bytes(addr, 8))[0]
+
+    def read_float(self, addr: int) -> float:
+        offset = addr - self.start
+        if 0 <= offset and addr + 4 <= self.end:
+            return _F32.unpack_from(self.data, offset)[0]
+        return _F32.unpack(self.memory.read_bytes(addr, 4))[0]
+
+    def write_float(self, addr: int, value: float) -> None:
+        offset = addr - self.start
+        if not (self.deferred and 0 <= offset and addr + 4 <= self.end):
+            self.write_bytes(addr, _F32.pack(value))
+            return
+        _F32.pack_into(self.data, offset, value)
+        if self._dirty_start is None or offset < self._dirty_start:
+            self._dirty_start = offset
+        if offset + 4 > self._dirty_end:
+            self._dirty_end = offset + 4
+
+    def unpack_from(self, layout: struct.Struct, addr: int) -> tuple[Any, ...]:
+        offset = addr - self.start
+        if 0 <= offset and addr + layout.size <= self.end:
+            return layout.unpack_from(self.data, offset)
+        return layout.unpack(self.memory.read_bytes(addr, layout.size))
+
+    def _decode(self, addr: int, length: int, encoding: str) -> str:
+        # Decode in-window text straight from the buffer instead of copying it out first.
+        offset = addr - self.start
+        if 0 <= offset and addr + length <= self.end:
+            return str(memoryview(self.data)[offset : offset + length], encoding, "ignore")
+        return self.memory.read_bytes(addr, length).decode(encoding, errors="ignore")
+
+    def read_wstring(self, addr: int, max_chars: int) -> str:
+        text = self._decode(addr, max_chars * 2, "utf-16le")
+        end = text.find("\x00")
+        return text[:end] if end != -1 else text
+
+    def write_wstring_fixed(self, addr: int, value: str, max_chars: int) -> None:
+        encoded = value[: max_chars - 1].encode("utf-16le") + b"\x00\x00"
+        self.write_bytes(addr, encoded.ljust(max_chars * 2, b"\x00"))
+
+    def read_ascii(self, addr: int, max_chars: int) -> str:
+        text = self._decode(addr, max_chars, "ascii")
+        end = text.find("\x00")
+        return text[:end] if end != -1 else text
+
+    def write_ascii_fixed(self, addr: int, value: str, max_chars: int) -> None:
+        encoded = value[: max_chars - 1].encode("ascii", errors="ignore") + b"\x00"
+        self.write_bytes(addr, encoded.ljust(max_chars, b"\x00"))
+
+
+__all__ = ["RecordBlock"]
@@ -26,6 +26,7 @@ if sys.platform == "win32":
     TH32CS_SNAPPROCESS = 0x00000002
     TH32CS_SNAPMODULE = 0x00000008
     TH32CS_SNAPMODULE32 = 0x00000010
+    STILL_ACTIVE = 259
 
     kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
 
@@ -89,6 +90,10 @@ if sys.platform == "win32":
     CloseHandle.argtypes = [wintypes.HANDLE]
     CloseHandle.restype = wintypes.BOOL
 
+    GetExitCodeProcess = kernel32.GetExitCodeProcess
+    GetExitCodeProcess.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+    GetExitCodeProcess.restype = wintypes.BOOL
+
     ReadProcessMemory = kernel32.ReadProcessMemory
     ReadProcessMemory.argtypes = [
         wintypes.HANDLE,
@@ -113,10 +118,11 @@ else:  # non-Windows
     PROCESS_QUERY_LIMITED_INFORMATION = PROCESS_QUERY_INFORMATION = 0
     PROCESS_ALL_ACCESS = 0
     TH32CS_SNAPPROCESS = TH32CS_SNAPMODULE = TH32CS_SNAPMODULE32 = 0
+    STILL_ACTIVE = 259
     MODULEENTRY32W = PROCESSENTRY32W = object  # type: ignore
     CreateToolhelp32Snapshot = Module32FirstW = Module32NextW = None
     Process32FirstW = Process32NextW = None
-    OpenProcess = CloseHandle = ReadProcessMemory = WriteProcessMemory = None
+    OpenProcess = CloseHandle = GetExitCodeProcess = ReadProcessMemory = WriteProcessMemory = None
 
 
 __all__ = [
@@ -129,6 +135,7 @@ __all__ = [
     "TH32CS_SNAPPROCESS",
     "TH32CS_SNAPMODULE",
     "TH32CS_SNAPMODULE32",
+    "STILL_ACTIVE",
     "MODULEENTRY32W",
     "PROCESSENTRY32W",
     "CreateToolhelp32Snapshot",
@@ -138,6 +145,7 @@ __all__ = [
     "Process32NextW",
     "OpenProcess",
     "CloseHandle",
+    "GetExitCodeProcess",
     "ReadProcessMemory",
     "WriteProcessMemory",
 ]
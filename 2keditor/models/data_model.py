@@ -2,25 +2,32 @@ from __future__ import annotations
 
 import queue
 import re
+import struct
 import threading
 from collections import OrderedDict
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from nba2k_editor.core import offsets as offsets_mod
 from nba2k_editor.core.addressing import record_address, resolve_base_pointer_entry
 from nba2k_editor.core.conversions import parse_id_prefixed_option
 from nba2k_editor.core.field_io import (
     _ADDRESS_DROPDOWN_TYPES,
+    _bit_window,
     _display_to_raw_value,
     _field_address,
     _id_prefixed_option,
     _implemented_payload,
+    _numeric_width,
+    _payload_spec,
     _raw_to_display_value,
     _read_authored_value,
+    _string_length,
     _type_key,
     _write_authored_value,
+    clear_payload_caches,
 )
 from nba2k_editor.memory.game_memory import GameMemory
+from nba2k_editor.memory.record_block import RecordBlock
 from nba2k_editor.models.schema import (
     FieldEntry,
     RecordListItem,
@@ -53,6 +60,8 @@ _MODEL_DOMAINS: tuple[str, ...] = tuple(_DOMAIN_BASE_KEYS)
 _SPARSE_SCAN_INVALID_STREAKS: dict[str, int] = {
     "NBA Records": 12,
 }
+_SCAN_PREFETCH_RECORDS = 64
+_SCAN_PREFETCH_MAX_RECORDS = 1024
 
 _LABEL_FIELD_NAMES: dict[str, tuple[str, ...]] = {
     "Players": ("FIRSTNAME", "LASTNAME"),
@@ -66,16 +75,176 @@ _LABEL_FIELD_NAMES: dict[str, tuple[str, ...]] = {
     "NBA Records": ("FIRSTNAME", "LASTNAME", "DATA"),
 }
 
+_PLAYER_RESET_NAME_VALUES: dict[str, int | str] = {
+    "FIRSTNAME": "A",
+    "LASTNAME": "Z",
+    "BIRTHYEAR": 2006,
+}
+
+_PLAYER_RESET_SECTION_VALUES: dict[str, int] = {
+    "Attributes": 25,
+    "Tendencies": 0,
+    "Badges": 0,
+}
+
+_POINTER_TARGET_DOMAINS = frozenset(_ADDRESS_DROPDOWN_TYPES.values())
+
 PLAYER_TEAM_FILTER_ALL = "All Players"
 PLAYER_TEAM_FILTER_BASE_TEAMS = "Teams 0-29"
 PLAYER_TEAM_FILTER_DRAFT_CLASS = "Draft Class"
 
 
+def _contiguous_index_runs(indexes: Iterable[int]) -> list[tuple[int, int]]:
+    runs: list[tuple[int, int]] = []
+    for index in sorted(set(indexes)):
+        if runs and runs[-1][0] + runs[-1][1] == index:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((index, 1))
+    return runs
+
+
+_ResetColumn = tuple[FieldEntry, Any, "dict[str, Any] | None", Any]
+
+
+_PACKED_INTEGER_CODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+_PACKED_RUN_MAX_GAP = 4
+
+
+def _packed_integer_runs(
+    layout: dict[str, tuple[dict[str, Any], str, int]],
+) -> list[tuple[struct.Struct, int, tuple[str, ...]]]:
+    """Group byte-aligned unsigned integer fields of a read layout into ``struct`` runs.
+
+    Returns ``(struct, record_offset, keys)`` per run of two or more fields whose bytes are
+    disjoint and at most ``_PACKED_RUN_MAX_GAP`` bytes apart; ``unpack_from`` yields one raw value per key.
+    """
+    fields: list[tuple[int, int, str]] = []
+    for key, (payload, _section, offset) in layout.items():
+        spec = _payload_spec(payload)
+        try:
+            if spec.bitfield:
+                bit_offset, bit_length, _width, _mask, sign_bit = _bit_window(payload)
+                if bit_offset % 8 or sign_bit or bit_length // 8 not in _PACKED_INTEGER_CODES or bit_length % 8:
+                    continue
+                fields.append((offset + bit_offset // 8, bit_length // 8, key))
+            elif spec.integer_io:
+                width = spec.width or _numeric_width(payload)
+                if width in _PACKED_INTEGER_CODES:
+                    fields.append((offset, width, key))
+        except Exception:
+            continue
+    fields.sort()
+    runs: list[tuple[struct.Struct, int, tuple[str, ...]]] = []
+    run: list[tuple[int, int, str]] = []
+
+    def close_run() -> None:
+        if len(run) < 2:
+            return
+        fmt = ["<"]
+        cursor = run[0][0]
+        for start, width, _key in run:
+            if start > cursor:
+                fmt.append(f"{start - cursor}x")
+            fmt.append(_PACKED_INTEGER_CODES[width])
+            cursor = start + width
+        runs.append((struct.Struct("".join(fmt)), run[0][0], tuple(key for _start, _width, key in run)))
+
+    for field in fields:
+        if run and not (run[-1][0] + run[-1][1] <= field[0] <= run[-1][0] + run[-1][1] + _PACKED_RUN_MAX_GAP):
+            close_run()
+            run = []
+        run.append(field)
+    close_run()
+    return runs
+
+
+def _payload_byte_range(payload: dict[str, Any]) -> tuple[int, int]:
+    """Return the record bytes ``[start, end)`` a fixed-offset write may touch; unknown spans cover the record."""
+    spec = _payload_spec(payload)
+    if spec.offset is None or spec.has_parent or spec.requires_deref:
+        return 0, 1 << 62
+    if spec.type_key in {"string", "wstring"}:
+        try:
+            chars = _string_length(payload)
+        except Exception:
+            return spec.offset, 1 << 62
+        return spec.offset, spec.offset + (chars * 2 if spec.type_key == "wstring" else chars) + 2
+    if spec.bitfield:
+        # A bitfield write touches the bytes covering bit_offset + bit_length, not the declared width.
+        try:
+            return spec.offset, spec.offset + _bit_window(payload)[2]
+        except Exception:
+            return spec.offset, 1 << 62
+    if spec.width is None:
+        return spec.offset, 1 << 62
+    return spec.offset, spec.offset + spec.width
+
+
+def _fused_bitfield_columns(
+    columns: list[_ResetColumn],
+    stride: int,
+    unresolved_range: Callable[[_ResetColumn], tuple[int, int]],
+) -> list[tuple[int, int, int, tuple[_ResetColumn, ...]]]:
+    """Pack fixed-offset bitfield columns that share an aligned 64-bit record word into one step.
+
+    Each step is ``(word_offset, mask, bits, members)``; ``word_offset`` is -1 for a column written on
+    its own. Members of a word keep plan order, so overlapping fields still resolve to the last write.
+    ``unresolved_range`` gives the record bytes a column without a fixed-offset payload may touch.
+    """
+    words: dict[int, list[Any]] = {}
+    steps: list[list[Any]] = []
+    for column in columns:
+        payload, raw_value = column[2], column[3]
+        spec = _payload_spec(payload) if payload is not None else None
+        if spec is not None and spec.bitfield and spec.implemented and spec.offset is not None and not (spec.has_parent or spec.requires_deref):
+            try:
+                bit_offset, _bit_length, _width, value_mask, _sign_bit = _bit_window(payload)
+                first_bit = spec.offset * 8 + bit_offset
+                word_offset = first_bit // 64 * 8
+                shift = first_bit - word_offset * 8
+                field_bits = int(raw_value) << shift
+            except Exception:
+                word_offset = -1
+            else:
+                if shift + _bit_length <= 64 and 0 <= word_offset and word_offset + 8 <= stride:
+                    field_mask = value_mask << shift
+                    word = words.get(word_offset)
+                    if word is None:
+                        word = words[word_offset] = [word_offset, 0, 0, []]
+                        steps.append(word)
+                    word[1] |= field_mask
+                    word[2] = (word[2] & ~field_mask) | (field_bits & field_mask)
+                    word[3].append(column)
+                    continue
+        steps.append([-1, 0, 0, [column]])
+    # A word only pays off when it replaces several writes, and it must not cover bytes that a
+    # separately written column also touches.
+    loose_ranges = [
+        _payload_byte_range(column[2]) if column[2] is not None else unresolved_range(column)
+        for step in steps
+        if step[0] < 0
+        for column in step[3]
+    ]
+    fused: list[tuple[int, int, int, tuple[_ResetColumn, ...]]] = []
+    for word_offset, mask, bits, members in steps:
+        overlaps = word_offset >= 0 and any(start < word_offset + 8 and word_offset < end for start, end in loose_ranges)
+        if word_offset >= 0 and len(members) > 1 and not overlaps:
+            fused.append((word_offset, mask, bits, tuple(members)))
+        else:
+            fused.extend((-1, 0, 0, (column,)) for column in members)
+    return fused
+
+
+_NAME_PUNCTUATION = str.maketrans("", "", " .'-")
+
+
 def _plausible_record_name_part(value: object) -> bool:
     text = str(value or "").strip()
     if len(text) < 2:
         return False
-    return any(char.isalpha() for char in text) and all(char.isalpha() or char in " .'-" for char in text)
+    # Letters plus name punctuation with at least one letter: drop the punctuation in one C pass, test the rest.
+    return text.translate(_NAME_PUNCTUATION).isalpha()
 
 
 def _valid_nba_record_label_values(values: list[Any]) -> bool:
@@ -92,7 +261,7 @@ def _valid_nba_record_label_values(values: list[Any]) -> bool:
 
 
 def _has_alpha_text(value: object) -> bool:
-    return any(char.isalpha() for char in str(value or ""))
+    return any(map(str.isalpha, str(value or "")))
 
 
 PLAYER_DETAIL_FIELD_SPECS: tuple[tuple[str, tuple[str, ...]], ...] = (
@@ -180,6 +349,10 @@ class EditorDataModel:
         self.target_executable = selected_target
         self.last_status = "not attached"
         self.loaded_items: dict[str, dict[str, RecordListItem]] = {domain: {} for domain in _MODEL_DOMAINS}
+        self._items_by_address: dict[str, dict[int, RecordListItem]] = {domain: {} for domain in _MODEL_DOMAINS}
+        self._items_by_index: dict[str, dict[int, RecordListItem]] = {domain: {} for domain in _MODEL_DOMAINS}
+        self._label_search_keys: dict[str, dict[str, str]] = {domain: {} for domain in _MODEL_DOMAINS}
+        self._label_search_buckets: dict[str, dict[str, list[str]]] = {}
         self.selected_items: dict[str, RecordListItem | None] = {domain: None for domain in _MODEL_DOMAINS}
         self.domain_statuses: dict[str, str] = {domain: self.runtime_status_text() for domain in _MODEL_DOMAINS}
         self.refresh_events: queue.Queue[tuple[str, str]] = queue.Queue()
@@ -190,11 +363,24 @@ class EditorDataModel:
         self._field_entries_cache: dict[str, tuple[FieldEntry, ...]] = {}
         self._field_context_cache: dict[str, dict[int, tuple[str, str]]] = {}
         self._field_lookup_cache: dict[str, dict[str, FieldEntry]] = {}
+        self._version_payload_cache: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
+        self._field_options_cache: dict[int, tuple[list[Any], tuple[str, ...]]] = {}
+        self._grouped_fields_cache: dict[str, OrderedDict[str, OrderedDict[str, list[FieldEntry]]]] = {}
         self._player_team_pointer_cache: dict[int, int] = {}
+        self._player_reset_plan: tuple[tuple[FieldEntry, int | str], ...] | None = None
+        self._team_slot_entries: tuple[tuple[int, FieldEntry], ...] | None = None
+        self._portable_roster_fields: dict[str, FieldEntry] | None = None
+        self._season_id_selector_lookup: dict[str, tuple[tuple[FieldEntry, ...], dict[str, FieldEntry]]] = {}
+        self._pointer_display_cache: dict[tuple[str, int], str | None] = {}
+        self._active_config_cache: dict[str, Any] | None = None
 
     def _active_config(self) -> dict[str, Any]:
-        self.offsets.initialize_offsets(self.target_executable, force=False)
-        return dict(self.offsets.get_active_offset_config(self.target_executable))
+        # Loading the config re-reads the league offsets file; strides and base pointers are looked up
+        # per record address, so resolve it once per target. Callers treat the result as read-only.
+        if self._active_config_cache is None:
+            self.offsets.initialize_offsets(self.target_executable, force=False)
+            self._active_config_cache = dict(self.offsets.get_active_offset_config(self.target_executable))
+        return self._active_config_cache
 
     def _domain_base_key(self, domain: str) -> str:
         if domain not in _DOMAIN_BASE_KEYS:
@@ -274,11 +460,25 @@ class EditorDataModel:
         self.target_executable = executable
         self.memory.module_name = executable
         self._layout_cache.clear()
+        clear_payload_caches()
         self._field_entries_cache.clear()
         self._field_context_cache.clear()
         self._field_lookup_cache.clear()
+        self._version_payload_cache.clear()
+        self._field_options_cache.clear()
+        self._grouped_fields_cache.clear()
         self._player_team_pointer_cache.clear()
+        self._player_reset_plan = None
+        self._team_slot_entries = None
+        self._portable_roster_fields = None
+        self._season_id_selector_lookup.clear()
+        self._pointer_display_cache.clear()
+        self._active_config_cache = None
         self.loaded_items = {domain: {} for domain in _MODEL_DOMAINS}
+        self._items_by_address = {domain: {} for domain in _MODEL_DOMAINS}
+        self._items_by_index = {domain: {} for domain in _MODEL_DOMAINS}
+        self._label_search_keys = {domain: {} for domain in _MODEL_DOMAINS}
+        self._label_search_buckets.clear()
         self.selected_items = {domain: None for domain in _MODEL_DOMAINS}
         self.last_status = self.runtime_status_text()
         self.domain_statuses = {domain: self.last_status for domain in _MODEL_DOMAINS}
@@ -286,6 +486,20 @@ class EditorDataModel:
     def domain_status(self, domain: str) -> str:
         return self.domain_statuses.get(domain, self.runtime_status_text())
 
+    def _set_loaded_items(self, domain: str, by_label: dict[str, RecordListItem]) -> None:
+        self.loaded_items[domain] = by_label
+        self._items_by_address[domain] = {int(item.address): item for item in by_label.values()}
+        self._items_by_index[domain] = {int(item.index): item for item in by_label.values()}
+        self._label_search_keys[domain] = {label: label.lower() for label in by_label}
+        self._label_search_buckets.pop(domain, None)
+        self._pointer_display_cache.clear()
+
+    def loaded_item_at_address(self, domain: str, address: int) -> RecordListItem | None:
+        return self._items_by_address.get(domain, {}).get(address)
+
+    def loaded_item_at_index(self, domain: str, index: int) -> RecordListItem | None:
+        return self._items_by_index.get(domain, {}).get(index)
+
     def domain_item_labels(self, domain: str) -> list[str]:
         return list(self.loaded_items[domain])
 
@@ -295,7 +509,12 @@ class EditorDataModel:
     def player_team_filter_options(self) -> tuple[str, ...]:
         return (PLAYER_TEAM_FILTER_ALL, PLAYER_TEAM_FILTER_BASE_TEAMS, PLAYER_TEAM_FILTER_DRAFT_CLASS, *self.domain_item_labels("Teams"))
 
-    def _team_player_slot_entries(self) -> list[tuple[int, FieldEntry]]:
+    def _team_player_slot_entries(self) -> tuple[tuple[int, FieldEntry], ...]:
+        if self._team_slot_entries is None:
+            self._team_slot_entries = self._build_team_player_slot_entries()
+        return self._team_slot_entries
+
+    def _build_team_player_slot_entries(self) -> tuple[tuple[int, FieldEntry], ...]:
         entries: list[tuple[int, FieldEntry]] = []
         for entry in self.grouped_fields("Teams").get("Team Players", {}).get("Team Players", ()):
             normalized = str(entry.normalized_name).strip().upper()
@@ -305,18 +524,21 @@ class EditorDataModel:
             if not suffix.isdigit():
                 continue
             entries.append((int(suffix), entry))
-        return sorted(entries, key=lambda item: item[0])[:15]
+        return tuple(sorted(entries, key=lambda item: item[0])[:15])
 
     def player_roster_slot_items_for_team_items(
         self,
         team_items: Iterable[RecordListItem],
     ) -> list[tuple[RecordListItem, dict[str, Any]]]:
-        players_by_address = {int(player.address): player for player in self.loaded_items.get("Players", {}).values()}
+        players_by_address = self._items_by_address.get("Players", {})
+        slot_entries = self._team_player_slot_entries()
         rows: list[tuple[RecordListItem, dict[str, Any]]] = []
         for team in team_items:
-            for roster_slot, entry in self._team_player_slot_entries():
+            team_index = int(team.index)
+            team_label = str(team.label)
+            for roster_slot, entry in slot_entries:
                 try:
-                    player_pointer = int(self.read_entry_value(entry, index=team.index).get("raw_value") or 0)
+                    player_pointer = int(self.read_entry_value(entry, index=team_index).get("raw_value") or 0)
                 except Exception:
                     continue
                 if not player_pointer:
@@ -328,8 +550,8 @@ class EditorDataModel:
                     (
                         player,
                         {
-                            "team_index": int(team.index),
-                            "team_label": str(team.label),
+                            "team_index": team_index,
+                            "team_label": team_label,
                             "team_slot": int(roster_slot),
                             "team_slot_field": str(entry.normalized_name),
                         },
@@ -380,9 +602,26 @@ class EditorDataModel:
     def player_items_for_team_filter(self, selected_team_label: str | None) -> dict[str, RecordListItem]:
         return self._player_filter_items(selected_team_label)
 
+    def _label_search_candidates(self, domain: str, query: str) -> list[str]:
+        buckets = self._label_search_buckets.get(domain)
+        if buckets is None:
+            buckets = {}
+            for label, key in self._label_search_keys.get(domain, {}).items():
+                for char in set(key):
+                    buckets.setdefault(char, []).append(label)
+            self._label_search_buckets[domain] = buckets
+        # Every match contains each query character, so only the smallest bucket needs a scan.
+        return min((buckets.get(char, []) for char in set(query)), key=len)
+
     def player_item_labels_for_team_filter(self, selected_team_label: str | None, search_text: str | None = None) -> list[str]:
         selected = str(selected_team_label or "").strip()
         query = str(search_text or "").strip().lower()
+        if query and selected in {PLAYER_TEAM_FILTER_DRAFT_CLASS, PLAYER_TEAM_FILTER_ALL, ""}:
+            domain = "Draft Class" if selected == PLAYER_TEAM_FILTER_DRAFT_CLASS else "Players"
+            if domain == "Draft Class":
+                self._ensure_draft_class_items_loaded()
+            search_keys = self._label_search_keys.get(domain, {})
+            return [label for label in self._label_search_candidates(domain, query) if query in search_keys[label]]
         if selected in {PLAYER_TEAM_FILTER_BASE_TEAMS, PLAYER_TEAM_FILTER_DRAFT_CLASS}:
             labels = list(self._player_filter_items(selected))
         elif not selected or selected == PLAYER_TEAM_FILTER_ALL:
@@ -391,14 +630,17 @@ class EditorDataModel:
             team = self.loaded_items["Teams"].get(selected)
             if team is None:
                 return []
+            team_address = team.address
+            team_pointer = self._player_current_team_pointer
             labels = [
                 label
                 for label, player in self.loaded_items["Players"].items()
-                if self._player_current_team_pointer(player) == team.address
+                if team_pointer(player) == team_address
             ]
         if not query:
             return labels
-        return [label for label in labels if query in label.lower()]
+        search_keys = self._label_search_keys.get("Players", {})
+        return [label for label in labels if query in (search_keys.get(label) or label.lower())]
 
     def is_player_season_id_selector_entry(self, entry: FieldEntry) -> bool:
         return _is_player_season_id_selector_entry(entry)
@@ -422,25 +664,32 @@ class EditorDataModel:
                 options.append(f"-- {label} ({stat_id})")
         return options
 
-    def _player_season_id_selector_entries(self, selector_role: object) -> list[FieldEntry]:
+    def _player_season_id_selector_entries(self, selector_role: object) -> tuple[FieldEntry, ...]:
+        return self._player_season_id_selector_index(selector_role)[0]
+
+    def _player_season_id_selector_index(self, selector_role: object) -> tuple[tuple[FieldEntry, ...], dict[str, FieldEntry]]:
         role = str(selector_role or _STAT_ROLE_SELECTOR).strip()
-        entries: list[FieldEntry] = []
-        for groups in self.grouped_fields("Players").values():
-            for group_entries in groups.values():
-                entries.extend(entry for entry in group_entries if _stat_role(entry.field) == role)
-        return entries
+        cached = self._season_id_selector_lookup.get(role)
+        if cached is None:
+            entries: list[FieldEntry] = []
+            for groups in self.grouped_fields("Players").values():
+                for group_entries in groups.values():
+                    entries.extend(entry for entry in group_entries if _stat_role(entry.field) == role)
+            by_identity: dict[str, FieldEntry] = {}
+            for entry in entries:
+                for key in (_field_identity(entry.normalized_name), _field_identity(_player_season_id_option_label(entry))):
+                    by_identity.setdefault(key, entry)
+            cached = self._season_id_selector_lookup[role] = (tuple(entries), by_identity)
+        return cached
 
     def _player_season_id_selector_entry_for_option(self, selected: object, *, selector_role: object = _STAT_ROLE_SELECTOR) -> FieldEntry:
         selected_identity = _player_season_id_identity_from_option(selected)
         if not selected_identity:
             raise ValueError("missing active Season Stat ID selector")
-        for entry in self._player_season_id_selector_entries(selector_role):
-            if selected_identity in {
-                _field_identity(entry.normalized_name),
-                _field_identity(_player_season_id_option_label(entry)),
-            }:
-                return entry
-        raise KeyError(f"unknown Season Stat ID selector: {selected}")
+        entry = self._player_season_id_selector_index(selector_role)[1].get(selected_identity)
+        if entry is None:
+            raise KeyError(f"unknown Season Stat ID selector: {selected}")
+        return entry
 
     def _selected_record_source_for_entry(self, entry: FieldEntry) -> dict[str, Any]:
         source = _selected_record_source(entry.field)
@@ -502,12 +751,20 @@ class EditorDataModel:
                 options[shoe_id] = _id_prefixed_option(shoe_id, item.label)
         return options
 
-    def field_options(self, entry: FieldEntry) -> list[str]:
+    def field_options(self, entry: FieldEntry) -> tuple[str, ...]:
         payload = self._field_version_payload(entry.field)
         if bool(payload.get("shoe_dropdown")):
-            return [option for _shoe_id, option in sorted(self._shoe_option_map().items())]
+            return tuple(option for _shoe_id, option in sorted(self._shoe_option_map().items()))
         raw_options = payload.get("dropdown") or payload.get("values")
-        return [str(option) for option in raw_options] if isinstance(raw_options, list) else []
+        if not isinstance(raw_options, list):
+            return ()
+        # Editor windows re-render every dropdown row; stringify each layout's option list once.
+        cached = self._field_options_cache.get(id(raw_options))
+        if cached is not None and cached[0] is raw_options:
+            return cached[1]
+        options = tuple(str(option) for option in raw_options)
+        self._field_options_cache[id(raw_options)] = (raw_options, options)
+        return options
 
     def selected_item(self, domain: str) -> RecordListItem | None:
         return self.selected_items[domain]
@@ -528,7 +785,7 @@ class EditorDataModel:
         try:
             items = self.scan_records(domain, limit=limit)
             by_label = {item.display_label: item for item in items}
-            self.loaded_items[domain] = by_label
+            self._set_loaded_items(domain, by_label)
             if domain == "Players":
                 self._player_team_pointer_cache.clear()
             labels = list(by_label)
@@ -542,7 +799,7 @@ class EditorDataModel:
                 self.domain_statuses[domain] = self.runtime_status_text()
             return items
         except Exception as exc:
-            self.loaded_items[domain] = {}
+            self._set_loaded_items(domain, {})
             self.selected_items[domain] = None
             if domain == "Players":
                 self._player_team_pointer_cache.clear()
@@ -571,6 +828,8 @@ class EditorDataModel:
             self.refresh_events.put(("done", ""))
 
     def pop_refresh_events(self) -> list[tuple[str, str]]:
+        if self.refresh_events.empty():
+            return []
         events: list[tuple[str, str]] = []
         while True:
             try:
@@ -754,6 +1013,12 @@ class EditorDataModel:
         item = self.selected_items["Teams"]
         if item is None:
             raise RuntimeError("select a team first")
+        try:
+            record_addr: int | None = self.record_address("Teams", item.index)
+        except Exception:
+            record_addr = None
+        # The summary fields all live in the team record; stage them so saving is one write.
+        block = self.record_block("Teams", record_addr, deferred=True) if record_addr is not None else None
         saved = 0
         failed = 0
         for label, candidates in TEAM_SUMMARY_FIELD_SPECS:
@@ -766,10 +1031,16 @@ class EditorDataModel:
                 failed += 1
                 continue
             try:
-                self.write_entry_value(entry, index=item.index, value=values.get(label, ""))
+                self.write_entry_value(entry, index=item.index, value=values.get(label, ""), record_addr=record_addr, memory=block)
                 saved += 1
             except Exception:
                 failed += 1
+        if block is not None:
+            try:
+                block.flush()
+            except Exception:
+                failed += saved
+                saved = 0
         return saved, failed
 
     def _record_data_entry(self) -> FieldEntry:
@@ -780,10 +1051,38 @@ class EditorDataModel:
 
     def save_record_data_values(self, values_by_index: dict[int, Any]) -> int:
         entry = self._record_data_entry()
+        values = {int(index): value for index, value in values_by_index.items()}
+        if not values:
+            return 0
+        base = self.domain_base("NBA Records")
+        stride = self.domain_stride("NBA Records")
+        write_entry_value = self.write_entry_value
         saved = 0
-        for index, value in values_by_index.items():
-            self.write_entry_value(entry, index=int(index), value=value)
-            saved += 1
+        # Adjacent records are staged in one deferred block so each run is one read and one write.
+        for first, count in _contiguous_index_runs(values):
+            run_addr = record_address(base=base, index=first, stride=stride)
+            block: RecordBlock | None = None
+            if count > 1:
+                try:
+                    block = RecordBlock.read(self.memory, run_addr, count * stride, deferred=True)
+                except Exception:
+                    block = None
+            try:
+                for offset in range(count):
+                    index = first + offset
+                    write_entry_value(entry, index=index, value=values[index], record_addr=run_addr + offset * stride, memory=block)
+                    saved += 1
+            except Exception:
+                # Keep the records written before the failure, but report the write error itself
+                # rather than anything the flush raises afterwards.
+                if block is not None:
+                    try:
+                        block.flush()
+                    except Exception:
+                        pass
+                raise
+            if block is not None:
+                block.flush()
         return saved
 
     def zero_record_data_values(self, indexes: Iterable[int]) -> int:
@@ -798,6 +1097,11 @@ class EditorDataModel:
         return "--" if item is None else f"0x{item.address:X}"
 
     def grouped_fields(self, domain: str) -> OrderedDict[str, OrderedDict[str, list[FieldEntry]]]:
+        if domain not in self._grouped_fields_cache:
+            self._grouped_fields_cache[domain] = self._build_grouped_fields(domain)
+        return self._grouped_fields_cache[domain]
+
+    def _build_grouped_fields(self, domain: str) -> OrderedDict[str, OrderedDict[str, list[FieldEntry]]]:
         grouped: OrderedDict[str, OrderedDict[str, list[FieldEntry]]] = OrderedDict()
         for entry in self._layout_entries(domain):
             try:
@@ -832,10 +1136,14 @@ class EditorDataModel:
             return None
         if pointer <= 0:
             return None
-        for item in self.loaded_items.get(target_domain, {}).values():
-            if item.address == pointer:
-                text = str(item.label).strip()
-                return text or None
+        item = self.loaded_item_at_address(target_domain, pointer)
+        if item is not None:
+            text = str(item.label).strip()
+            return text or None
+        # Many records point at the same few targets; remember labels read from memory.
+        cache_key = (target_domain, pointer)
+        if cache_key in self._pointer_display_cache:
+            return self._pointer_display_cache[cache_key]
         try:
             target_base = self.domain_base(target_domain)
             target_stride = self.domain_stride(target_domain)
@@ -845,13 +1153,15 @@ class EditorDataModel:
             return None
         delta = pointer - target_base
         if delta < 0 or delta % target_stride != 0:
+            self._pointer_display_cache[cache_key] = None
             return None
         try:
             label = self._label_for_record_address(target_domain, delta // target_stride, pointer, self._label_entries(target_domain))
         except Exception:
             return None
-        text = str(label).strip()
-        return text or None
+        text = str(label).strip() or None
+        self._pointer_display_cache[cache_key] = text
+        return text
 
     def _pointer_display_for_payload(self, payload: dict[str, Any], raw_value: Any) -> str | None:
         target_domain = _ADDRESS_DROPDOWN_TYPES.get(_type_key(payload))
@@ -866,12 +1176,25 @@ class EditorDataModel:
                 return None
         return None
 
-    def _read_field_at_record_address(self, domain: str, record_addr: int, field: dict[str, Any]) -> dict[str, Any]:
+    def record_block(self, domain: str, record_addr: int, *, deferred: bool = False, records: int = 1) -> RecordBlock | None:
+        try:
+            return RecordBlock.read(self.memory, record_addr, records * self.domain_stride(domain), deferred=deferred)
+        except Exception:
+            return None
+
+    def record_blocks(self, spans: Iterable[tuple[int, int]], *, deferred: bool = False) -> list[RecordBlock | None]:
+        """Read one block per ``(record_addr, length)`` span in a single batch."""
+        return RecordBlock.read_many(self.memory, tuple(spans), deferred=deferred)
+
+    def _read_field_at_record_address(self, domain: str, record_addr: int, field: dict[str, Any], memory: Any | None = None) -> dict[str, Any]:
+        memory = self.memory if memory is None else memory
         payload = self._field_version_payload(field)
-        address = _field_address(self.memory, record_addr, payload, parent_payload=self._parent_payload(domain, payload))
-        raw_value = _read_authored_value(self.memory, address, payload)
+        spec = _payload_spec(payload)
+        parent_payload = self._parent_payload(domain, payload) if spec.has_parent else None
+        address = _field_address(memory, record_addr, payload, parent_payload=parent_payload)
+        raw_value = _read_authored_value(memory, address, payload)
         section, _group = self._field_context(domain, field)
-        display_value = self._pointer_display_for_payload(payload, raw_value)
+        display_value = self._pointer_display_for_payload(payload, raw_value) if spec.display_lookup else None
         if display_value is None:
             display_value = _raw_to_display_value(section, field, payload, raw_value)
         return {
@@ -879,36 +1202,46 @@ class EditorDataModel:
             "address": address,
             "raw_value": raw_value,
             "display_value": display_value,
-            "writeable": not bool(payload.get("readonly")) and _implemented_payload(payload),
-            "value_behavior": "implemented" if _implemented_payload(payload) else "implementation_required",
+            "writeable": not spec.readonly and spec.implemented,
+            "value_behavior": "implemented" if spec.implemented else "implementation_required",
         }
 
-    def _write_field_at_record_address(self, domain: str, record_addr: int, field: dict[str, Any], value: Any) -> Any:
+    def _write_field_at_record_address(self, domain: str, record_addr: int, field: dict[str, Any], value: Any, memory: Any | None = None) -> Any:
+        memory = self.memory if memory is None else memory
         payload = self._field_version_payload(field)
-        if bool(payload.get("readonly")):
+        spec = _payload_spec(payload)
+        if spec.readonly:
             raise PermissionError(f"field is readonly: {field.get('normalized_name') or field.get('display_name')}")
-        address = _field_address(self.memory, record_addr, payload, parent_payload=self._parent_payload(domain, payload))
+        parent_payload = self._parent_payload(domain, payload) if spec.has_parent else None
+        address = _field_address(memory, record_addr, payload, parent_payload=parent_payload)
         section, _group = self._field_context(domain, field)
-        raw_value = parse_id_prefixed_option(value) if bool(payload.get("shoe_dropdown")) else None
+        raw_value = parse_id_prefixed_option(value) if spec.shoe_dropdown else None
         if raw_value is None:
             raw_value = _display_to_raw_value(section, field, payload, value)
-        _write_authored_value(self.memory, address, payload, raw_value)
+        _write_authored_value(memory, address, payload, raw_value)
         return raw_value
 
-    def _label_for_record_address(self, domain: str, index: int, record_addr: int, label_entries: list[FieldEntry]) -> str:
+    def _label_for_record_address(
+        self,
+        domain: str,
+        index: int,
+        record_addr: int,
+        label_entries: list[FieldEntry],
+        memory: Any | None = None,
+    ) -> str:
         labels: list[str] = []
         values: list[Any] = []
         for entry in label_entries:
-            value = self._read_field_at_record_address(domain, record_addr, entry.field)["display_value"]
+            value = self._read_field_at_record_address(domain, record_addr, entry.field, memory)["display_value"]
             values.append(value)
             text = str(value).strip()
             if text:
                 labels.append(text)
-        if not self._valid_label_values(domain, record_addr, values, labels):
+        if not self._valid_label_values(domain, record_addr, values, labels, memory):
             return ""
         return " ".join(labels)
 
-    def _valid_label_values(self, domain: str, record_addr: int, values: list[Any], labels: list[str]) -> bool:
+    def _valid_label_values(self, domain: str, record_addr: int, values: list[Any], labels: list[str], memory: Any | None = None) -> bool:
         if domain == "NBA Records":
             return _valid_nba_record_label_values(values)
         if domain == "NBA History":
@@ -916,7 +1249,7 @@ class EditorDataModel:
             if type_entry is None:
                 return bool(labels)
             try:
-                raw_type = int(self._read_field_at_record_address(domain, record_addr, type_entry.field)["raw_value"])
+                raw_type = int(self._read_field_at_record_address(domain, record_addr, type_entry.field, memory)["raw_value"])
             except Exception:
                 return False
             if raw_type <= 0:
@@ -941,11 +1274,33 @@ class EditorDataModel:
         invalid_streak_stop = _SPARSE_SCAN_INVALID_STREAKS.get(domain, 1)
         invalid_streak = 0
         items: list[RecordListItem] = []
+        # Label fields are read from a prefetched window of records, one process read per window.
+        # Windows start small and double up to _SCAN_PREFETCH_MAX_RECORDS, so short tables read little
+        # past their end and a full player table is a handful of reads.
+        window: Any = self.memory
+        window_end = 0
+        window_records = _SCAN_PREFETCH_RECORDS
+        window_cap = _SCAN_PREFETCH_MAX_RECORDS
         index = 0
         while explicit_limit is None or index < explicit_limit:
             address = record_address(base=base, index=index, stride=stride)
+            if address >= window_end:
+                count = window_records if explicit_limit is None else min(window_records, explicit_limit - index)
+                try:
+                    window = RecordBlock.read(self.memory, address, count * stride)
+                except Exception:
+                    window = self.memory
+                    if count > _SCAN_PREFETCH_RECORDS:
+                        # A large window can run past mapped memory at the table end; retry at the base size.
+                        count = window_cap = _SCAN_PREFETCH_RECORDS
+                        try:
+                            window = RecordBlock.read(self.memory, address, count * stride)
+                        except Exception:
+                            window = self.memory
+                window_end = address + count * stride
+                window_records = min(window_records * 2, window_cap)
             try:
-                label = self._label_for_record_address(domain, index, address, label_entries)
+                label = self._label_for_record_address(domain, index, address, label_entries, window)
             except Exception:
                 if not items and index == 0:
                     raise
@@ -963,56 +1318,177 @@ class EditorDataModel:
             index += 1
         return items
 
-    def read_entry_value(self, entry: FieldEntry, *, index: int, stat_selector: object | None = None) -> dict[str, Any]:
+    def read_entry_value(
+        self,
+        entry: FieldEntry,
+        *,
+        index: int,
+        stat_selector: object | None = None,
+        record_addr: int | None = None,
+        memory: Any | None = None,
+    ) -> dict[str, Any]:
         if stat_selector is not None and _is_player_selected_stat_detail_entry(entry):
             return self._read_field_at_record_address(
                 entry.domain,
                 self._player_season_stat_detail_base_address(entry, index, stat_selector),
                 entry.field,
             )
-        return self.read_value(entry.domain, index=index, field=entry.field)
+        return self.read_value(entry.domain, index=index, field=entry.field, record_addr=record_addr, memory=memory)
 
-    def write_entry_value(self, entry: FieldEntry, *, index: int, value: Any, stat_selector: object | None = None) -> None:
+    def write_entry_value(
+        self,
+        entry: FieldEntry,
+        *,
+        index: int,
+        value: Any,
+        stat_selector: object | None = None,
+        record_addr: int | None = None,
+        memory: Any | None = None,
+    ) -> None:
         if stat_selector is not None and _is_player_selected_stat_detail_entry(entry):
-            record_addr = self._player_season_stat_detail_base_address(entry, index, stat_selector)
-            self._write_field_at_record_address(entry.domain, record_addr, entry.field, value)
+            stat_record_addr = self._player_season_stat_detail_base_address(entry, index, stat_selector)
+            self._write_field_at_record_address(entry.domain, stat_record_addr, entry.field, value)
             return
-        self.write_value(entry.domain, index=index, field=entry.field, value=value)
+        self.write_value(entry.domain, index=index, field=entry.field, value=value, record_addr=record_addr, memory=memory)
 
     def reset_player_editor_values(self, *, index: int, stat_selector: object | None = None) -> dict[str, int]:
+        return self.reset_player_editor_values_for_indexes((index,), stat_selector=stat_selector)
+
+    def reset_player_editor_values_for_indexes(self, indexes: Iterable[int], *, stat_selector: object | None = None) -> dict[str, int]:
+        runs = _contiguous_index_runs(indexes)
+        if not runs:
+            # Nothing selected: skip building the reset plan and resolving the table base.
+            return {"attempted": 0, "succeeded": 0, "failed": 0}
+        plan = self._player_editor_reset_plan()
+        try:
+            base: int | None = self.domain_base("Players")
+            stride = self.domain_stride("Players")
+        except Exception:
+            base = None
+            stride = 0
+        steps = _fused_bitfield_columns(
+            self._player_reset_columns(plan, stat_selector=stat_selector),
+            stride,
+            lambda column: self._reset_column_byte_range(column, stat_selector),
+        )
         attempted = 0
         succeeded = 0
         failed = 0
-        for groups in self.grouped_fields("Players").values():
-            for entries in groups.values():
-                for entry in entries:
-                    value = self._player_editor_reset_value(entry)
-                    if value is None:
+        write_entry_value = self.write_entry_value
+        # Adjacent players are staged in one deferred block so a contiguous selection is one read
+        # and one write, and bitfields sharing a word are written once with their final value.
+        for first, count in runs:
+            run_addr = record_address(base=base, index=first, stride=stride) if base is not None else None
+            block: RecordBlock | None = None
+            if run_addr is not None:
+                try:
+                    block = RecordBlock.read(self.memory, run_addr, count * stride, deferred=True)
+                except Exception:
+                    block = None
+            attempted += len(plan) * count
+            run_succeeded = 0
+            # Walk the plan a field at a time so each fixed-offset field is one column pass over the run;
+            # bitfields packed into the same record word are one masked word write per record.
+            for word_offset, mask, bits, members in steps:
+                if word_offset >= 0 and block is not None and run_addr is not None:
+                    fields = len(members)
+                    for offset in range(count):
+                        try:
+                            block.write_bits(run_addr + word_offset + offset * stride, 8, mask, bits)
+                            run_succeeded += fields
+                        except Exception:
+                            failed += fields
+                    continue
+                for entry, value, payload, raw_value in members:
+                    if payload is not None and block is not None and run_addr is not None:
+                        address = _field_address(block, run_addr, payload)
+                        for offset in range(count):
+                            try:
+                                _write_authored_value(block, address + offset * stride, payload, raw_value)
+                                run_succeeded += 1
+                            except Exception:
+                                failed += 1
                         continue
-                    attempted += 1
-                    try:
-                        self.write_entry_value(entry, index=index, value=value, stat_selector=stat_selector)
-                        succeeded += 1
-                    except Exception:
-                        failed += 1
+                    for offset in range(count):
+                        record_addr = run_addr + offset * stride if run_addr is not None else None
+                        try:
+                            write_entry_value(entry, index=first + offset, value=value, stat_selector=stat_selector, record_addr=record_addr, memory=block)
+                            run_succeeded += 1
+                        except Exception:
+                            failed += 1
+            if run_succeeded and self._pointer_display_cache and "Players" in _POINTER_TARGET_DOMAINS:
+                self._pointer_display_cache.clear()
+            if block is not None:
+                try:
+                    block.flush()
+                except Exception:
+                    failed += run_succeeded
+                    run_succeeded = 0
+            succeeded += run_succeeded
         return {"attempted": attempted, "succeeded": succeeded, "failed": failed}
 
+    def _reset_column_byte_range(self, column: _ResetColumn, stat_selector: object | None) -> tuple[int, int]:
+        """Return the player-record bytes a column written through write_entry_value may touch."""
+        entry = column[0]
+        if stat_selector is not None and _is_player_selected_stat_detail_entry(entry):
+            # Selected stat details are written into the season stat record, not the player record.
+            return 0, 0
+        try:
+            return _payload_byte_range(self._field_version_payload(entry.field))
+        except Exception:
+            return 0, 1 << 62
+
+    def _player_reset_columns(
+        self,
+        plan: tuple[tuple[FieldEntry, int | str], ...],
+        *,
+        stat_selector: object | None,
+    ) -> list[tuple[FieldEntry, int | str, dict[str, Any] | None, Any]]:
+        # Fields at a fixed record offset convert their reset value to raw once per call; pointer-chased,
+        # stat-detail and current-team fields keep the per-record write_entry_value path.
+        columns: list[tuple[FieldEntry, int | str, dict[str, Any] | None, Any]] = []
+        for entry, value in plan:
+            field = entry.field
+            payload: dict[str, Any] | None = None
+            raw_value: Any = None
+            if not (stat_selector is not None and _is_player_selected_stat_detail_entry(entry)) and _field_identity(
+                field.get("normalized_name") or field.get("display_name")
+            ) != "CURRENTTEAM":
+                try:
+                    candidate = self._field_version_payload(field)
+                    spec = _payload_spec(candidate)
+                    if not (spec.readonly or spec.has_parent or spec.requires_deref):
+                        raw_value = parse_id_prefixed_option(value) if spec.shoe_dropdown else None
+                        if raw_value is None:
+                            section, _group = self._field_context(entry.domain, field)
+                            raw_value = _display_to_raw_value(section, field, candidate, value)
+                        payload = candidate
+                except Exception:
+                    payload = None
+            columns.append((entry, value, payload, raw_value))
+        return columns
+
+    def _player_editor_reset_plan(self) -> tuple[tuple[FieldEntry, int | str], ...]:
+        if self._player_reset_plan is None:
+            plan: list[tuple[FieldEntry, int | str]] = []
+            for groups in self.grouped_fields("Players").values():
+                for entries in groups.values():
+                    for entry in entries:
+                        value = self._player_editor_reset_value(entry)
+                        if value is not None:
+                            plan.append((entry, value))
+            self._player_reset_plan = tuple(plan)
+        return self._player_reset_plan
+
     def _player_editor_reset_value(self, entry: FieldEntry) -> int | str | None:
         if entry.domain != "Players":
             return None
-        normalized = str(entry.normalized_name).upper()
-        if normalized == "FIRSTNAME":
-            return "A"
-        if normalized == "LASTNAME":
-            return "Z"
-        if normalized == "BIRTHYEAR":
-            return 2006
-        if entry.section == "Attributes":
-            return 25
-        if entry.section == "Tendencies":
-            return 0
-        if entry.section == "Badges":
-            return 0
+        value = _PLAYER_RESET_NAME_VALUES.get(str(entry.normalized_name).upper())
+        if value is not None:
+            return value
+        value = _PLAYER_RESET_SECTION_VALUES.get(entry.section)
+        if value is not None:
+            return value
         if _is_player_season_id_selector_entry(entry):
             return 65535
         return None
@@ -1020,10 +1496,10 @@ class EditorDataModel:
     def export_player_roster_snapshot(self, *, limit: int | None = None, progress_callback: Any | None = None) -> dict[str, Any]:
         return self.export_player_roster_snapshot_for_items(self.scan_records("Players", limit=limit), progress_callback=progress_callback)
 
-    def _read_player_snapshot_entry_value(self, item: RecordListItem, entry: FieldEntry) -> dict[str, Any]:
+    def _player_snapshot_record_address(self, item: RecordListItem) -> int:
         if item.domain == "Draft Class":
-            return self._read_field_at_record_address("Draft Class", item.address, entry.field)
-        return self.read_entry_value(entry, index=item.index)
+            return int(item.address)
+        return self.record_address("Players", item.index)
 
     def export_player_roster_snapshot_for_items(
         self,
@@ -1033,22 +1509,79 @@ class EditorDataModel:
         mode: str = "custom",
         placements: Iterable[dict[str, Any] | None] | None = None,
     ) -> dict[str, Any]:
-        entries = tuple(self._portable_player_roster_entries())
+        entries = self._portable_player_roster_fields()
         records: list[dict[str, Any]] = []
         selected_items = tuple(items)
         selected_placements = tuple(placements) if placements is not None else tuple(None for _item in selected_items)
         if len(selected_placements) != len(selected_items):
             raise ValueError("player roster placements must match exported items")
         total = len(selected_items)
+        targets = [
+            ("Draft Class" if item.domain == "Draft Class" else "Players", self._player_snapshot_record_address(item))
+            for item in selected_items
+        ]
+        strides: dict[str, int] = {}
+        for domain, _addr in targets:
+            if domain not in strides:
+                try:
+                    strides[domain] = self.domain_stride(domain)
+                except Exception:
+                    strides[domain] = 0
+        # Consecutive records share one prefetched window, and every window is requested in one batch
+        # so the memory backend can merge nearby ones into fewer process reads.
+        windows: list[RecordBlock | None] = [None] * total
+        spans: list[tuple[int, int]] = []
+        span_targets: list[tuple[int, int]] = []
+        position = 0
+        while position < total:
+            read_domain, record_addr = targets[position]
+            stride = strides[read_domain]
+            count = 1
+            if stride > 0:
+                while (
+                    count < _SCAN_PREFETCH_RECORDS
+                    and position + count < total
+                    and targets[position + count] == (read_domain, record_addr + count * stride)
+                ):
+                    count += 1
+                spans.append((record_addr, count * stride))
+                span_targets.append((position, count))
+            position += count
+        for (first, count), window in zip(span_targets, self.record_blocks(spans)):
+            windows[first : first + count] = [window] * count
+        layouts: dict[str, tuple[dict[str, tuple[dict[str, Any], str, int]], list[tuple[struct.Struct, int, tuple[str, ...]]]]] = {}
         if progress_callback is not None:
             progress_callback(0, total, "Exporting player roster...")
         for current, (item, placement) in enumerate(zip(selected_items, selected_placements), start=1):
             fields: dict[str, dict[str, Any]] = {}
-            for entry in entries:
-                value = self._read_player_snapshot_entry_value(item, entry)
-                fields[f"{entry.section}/{entry.normalized_name}"] = {
-                    "display_value": _json_safe_roster_value(value.get("display_value")),
-                    "raw_value": _json_safe_roster_value(value.get("raw_value")),
+            read_domain, record_addr = targets[current - 1]
+            block = windows[current - 1]
+            cached_layout = layouts.get(read_domain)
+            if cached_layout is None:
+                layout = self._fixed_offset_read_layout(read_domain, entries)
+                cached_layout = layouts[read_domain] = (layout, _packed_integer_runs(layout))
+            layout, packed_runs = cached_layout
+            # Byte-aligned integer runs come out of the window with one unpack per run.
+            packed: dict[str, int] = {}
+            if block is not None:
+                for run_struct, run_offset, run_keys in packed_runs:
+                    packed.update(zip(run_keys, block.unpack_from(run_struct, record_addr + run_offset)))
+            for key, entry in entries.items():
+                fixed = layout.get(key)
+                if fixed is not None:
+                    payload, section, offset = fixed
+                    if key in packed:
+                        raw_value = packed[key]
+                    else:
+                        raw_value = _read_authored_value(block if block is not None else self.memory, record_addr + offset, payload)
+                    display_value = _raw_to_display_value(section, entry.field, payload, raw_value)
+                else:
+                    value = self._read_field_at_record_address(read_domain, record_addr, entry.field, block)
+                    raw_value = value.get("raw_value")
+                    display_value = value.get("display_value")
+                fields[key] = {
+                    "display_value": _json_safe_roster_value(display_value),
+                    "raw_value": _json_safe_roster_value(raw_value),
                 }
             record: dict[str, Any] = {"index": item.index, "label": item.label, "fields": fields}
             if placement:
@@ -1064,6 +1597,22 @@ class EditorDataModel:
             "records": records,
         }
 
+    def _fixed_offset_read_layout(self, domain: str, entries: dict[str, FieldEntry]) -> dict[str, tuple[dict[str, Any], str, int]]:
+        # Resolve payload, section and record offset once per export for fields read straight from the
+        # record; parent-relative, pointer-chased and lookup-displayed fields keep the per-record path.
+        layout: dict[str, tuple[dict[str, Any], str, int]] = {}
+        for key, entry in entries.items():
+            try:
+                payload = self._field_version_payload(entry.field)
+                spec = _payload_spec(payload)
+            except Exception:
+                continue
+            if spec.offset is None or not spec.readable or spec.has_parent or spec.requires_deref or spec.display_lookup:
+                continue
+            section, _group = self._field_context(domain, entry.field)
+            layout[key] = (payload, section, spec.offset)
+        return layout
+
     def _team_item_for_snapshot_row(self, row: dict[str, Any]) -> RecordListItem | None:
         team_index = row.get("team_index")
         if team_index is not None:
@@ -1072,9 +1621,9 @@ class EditorDataModel:
             except Exception:
                 wanted_index = None
             if wanted_index is not None:
-                for team in self.loaded_items.get("Teams", {}).values():
-                    if int(team.index) == wanted_index:
-                        return team
+                team = self.loaded_item_at_index("Teams", wanted_index)
+                if team is not None:
+                    return team
         team_label = str(row.get("team_label") or "").strip()
         if team_label:
             return self.loaded_items.get("Teams", {}).get(team_label)
@@ -1101,7 +1650,7 @@ class EditorDataModel:
         progress_callback: Any | None = None,
         target_items: Iterable[RecordListItem] | None = None,
     ) -> dict[str, int]:
-        entries = {f"{entry.section}/{entry.normalized_name}": entry for entry in self._portable_player_roster_entries()}
+        entries = self._portable_player_roster_fields()
         records = snapshot.get("records") if isinstance(snapshot, dict) else None
         if not isinstance(records, list):
             raise ValueError("player roster snapshot is missing records")
@@ -1124,6 +1673,12 @@ class EditorDataModel:
         placement_attempted = 0
         placement_succeeded = 0
         placement_failed = 0
+        try:
+            players_base: int | None = self.domain_base("Players")
+            players_stride = self.domain_stride("Players")
+        except Exception:
+            players_base = None
+        write_entry_value = self.write_entry_value
         for current, row in enumerate(target_records, start=1):
             if not isinstance(row, dict):
                 skipped += 1
@@ -1171,6 +1726,21 @@ class EditorDataModel:
                     continue
                 target_domain = "Players"
                 target_record_addr = None
+            draft_target = target_domain == "Draft Class" and target_record_addr is not None
+            if draft_target:
+                row_record_addr: int | None = int(target_record_addr)
+            elif players_base is not None:
+                row_record_addr = record_address(base=players_base, index=index, stride=players_stride)
+            else:
+                row_record_addr = None
+            # Stage the row's fields in one deferred block and write it back before the next row, so the
+            # bytes copied from the game are only held for the time it takes to apply one row.
+            block = (
+                self.record_block("Draft Class" if draft_target else "Players", row_record_addr, deferred=True)
+                if row_record_addr is not None
+                else None
+            )
+            row_succeeded = 0
             for key, payload in fields.items():
                 entry = entries.get(str(key))
                 if entry is None:
@@ -1179,13 +1749,20 @@ class EditorDataModel:
                 value = self._snapshot_write_value(row, entry, payload)
                 attempted += 1
                 try:
-                    if target_domain == "Draft Class" and target_record_addr is not None:
-                        self._write_field_at_record_address("Draft Class", int(target_record_addr), entry.field, value)
+                    if draft_target:
+                        self._write_field_at_record_address("Draft Class", int(target_record_addr), entry.field, value, memory=block)
                     else:
-                        self.write_entry_value(entry, index=index, value=value)
-                    succeeded += 1
+                        write_entry_value(entry, index=index, value=value, record_addr=row_record_addr, memory=block)
+                    row_succeeded += 1
                 except Exception:
                     failed += 1
+            if block is not None:
+                try:
+                    block.flush()
+                except Exception:
+                    failed += row_succeeded
+                    row_succeeded = 0
+            succeeded += row_succeeded
             if progress_callback is not None:
                 progress_callback(min(current, total), total, f"Applying roster: {min(current, total)}/{total} players")
         return {
@@ -1198,6 +1775,11 @@ class EditorDataModel:
             "placement_failed": placement_failed,
         }
 
+    def _portable_player_roster_fields(self) -> dict[str, FieldEntry]:
+        if self._portable_roster_fields is None:
+            self._portable_roster_fields = {f"{entry.section}/{entry.normalized_name}": entry for entry in self._portable_player_roster_entries()}
+        return self._portable_roster_fields
+
     def _portable_player_roster_entries(self) -> list[FieldEntry]:
         entries: list[FieldEntry] = []
         for groups in self.grouped_fields("Players").values():
@@ -1238,7 +1820,25 @@ class EditorDataModel:
     def record_address(self, domain: str, index: int) -> int:
         return record_address(base=self.domain_base(domain), index=index, stride=self.domain_stride(domain))
 
+    def record_addresses(self, domain: str, indexes: Iterable[int]) -> dict[int, int]:
+        try:
+            base = self.domain_base(domain)
+            stride = self.domain_stride(domain)
+        except Exception:
+            return {}
+        addresses: dict[int, int] = {}
+        for index in indexes:
+            try:
+                addresses[index] = record_address(base=base, index=index, stride=stride)
+            except ValueError:
+                continue
+        return addresses
+
     def _field_version_payload(self, field: dict[str, Any]) -> dict[str, Any]:
+        # Version selection re-parses every version key, so resolve each field once per target.
+        cached = self._version_payload_cache.get(id(field))
+        if cached is not None and cached[0] is field:
+            return cached[1]
         versions = field.get("versions")
         if not isinstance(versions, dict):
             raise KeyError("field is missing authored versions")
@@ -1248,13 +1848,37 @@ class EditorDataModel:
             raise KeyError(f"field has no active version for {self.target_executable}") from exc
         if not isinstance(payload, dict):
             raise TypeError(f"selected payload for {target} must be an object")
+        self._version_payload_cache[id(field)] = (field, payload)
         return payload
 
-    def read_value(self, domain: str, *, index: int, field: dict[str, Any]) -> dict[str, Any]:
-        return self._read_field_at_record_address(domain, self.record_address(domain, index), field)
+    def read_value(
+        self,
+        domain: str,
+        *,
+        index: int,
+        field: dict[str, Any],
+        record_addr: int | None = None,
+        memory: Any | None = None,
+    ) -> dict[str, Any]:
+        if record_addr is None:
+            record_addr = self.record_address(domain, index)
+        return self._read_field_at_record_address(domain, record_addr, field, memory)
 
-    def write_value(self, domain: str, *, index: int, field: dict[str, Any], value: Any) -> None:
-        raw_value = self._write_field_at_record_address(domain, self.record_address(domain, index), field, value)
+    def write_value(
+        self,
+        domain: str,
+        *,
+        index: int,
+        field: dict[str, Any],
+        value: Any,
+        record_addr: int | None = None,
+        memory: Any | None = None,
+    ) -> None:
+        if record_addr is None:
+            record_addr = self.record_address(domain, index)
+        raw_value = self._write_field_at_record_address(domain, record_addr, field, value, memory)
+        if self._pointer_display_cache and domain in _POINTER_TARGET_DOMAINS:
+            self._pointer_display_cache.clear()
         if domain == "Players" and _field_identity(field.get("normalized_name") or field.get("display_name")) == "CURRENTTEAM":
             try:
                 self._player_team_pointer_cache[index] = int(raw_value)
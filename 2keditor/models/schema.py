@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Iterable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldEntry:
     domain: str
     section: str
@@ -22,7 +24,7 @@ class FieldEntry:
         return str(self.field.get("display_name") or self.normalized_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordListItem:
     domain: str
     index: int
@@ -34,8 +36,18 @@ class RecordListItem:
         return f"[{self.index}] {self.label}"
 
 
+_NON_IDENTITY_RE = re.compile(r"[^A-Z0-9]+")
+
+
 def _field_identity(value: object) -> str:
-    return re.sub(r"[^A-Z0-9]+", "", str(value or "").upper())
+    return _identity_text(str(value or ""))
+
+
+# Lookups normalize the same handful of field names over and over; interning the
+# keys lets the field-lookup dict probes hit on identity.
+@lru_cache(maxsize=8192)
+def _identity_text(text: str) -> str:
+    return sys.intern(_NON_IDENTITY_RE.sub("", text.upper()))
 
 
 def _field_display_or_name(field: dict[str, Any]) -> str:
@@ -3,12 +3,14 @@ from __future__ import annotations
 import json
 import re
 import threading
+import time
 from importlib import import_module
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from nba2k_editor.core.conversions import parse_id_prefixed_option
 from nba2k_editor.models.team_record_routing import (
+    TEAM_RECORD_SECTION_ROW_LAYOUT,
     TEAM_RECORD_SECTION_STAT_TABS,
     TEAM_RECORD_SIDE_NAV,
     team_record_indexes,
@@ -37,6 +39,8 @@ class _OperationCancelled(Exception):
 RECORD_LIST_ROW_HEIGHT = 19
 RECORD_LIST_VERTICAL_MARGIN = 140
 MIN_RECORD_LIST_ROWS = 8
+PLAYER_SEARCH_DEBOUNCE_SECONDS = 0.06
+GENERATOR_DISPLAY_MAX_ROWS = 1000
 PLAYER_GENERATOR_SCREEN = "Player Generator"
 FRANCHISE_MANAGER_SCREEN = "Franchise Manager"
 TARGET_CHOICES: tuple[str, ...] = ("NBA 2K22", "NBA 2K23", "NBA 2K24", "NBA 2K25", "NBA 2K26")
@@ -131,12 +135,19 @@ HISTORY_TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
     "League Leaders": ("Rank", "Season", "Team Logo", "Team City", "Team Name", "First Name", "Last Name", "Data"),
     "Hall of Famers": ("Rank", "Season", "Team Logo", "Team City", "Team Name", "First Name", "Last Name"),
 }
+HISTORY_CELL_SOURCE_LABELS: dict[str, str] = {
+    "Winner Team City": "Team City",
+    "Winner Team Name": "Team Name",
+}
 RECORD_SECTION_ROW_LAYOUT: dict[str, tuple[int, int]] = {
     "Single Game (Regular)": (0, 5),
     "Single Game (Playoffs)": (50, 5),
     "Season": (100, 10),
     "Career": (350, 100),
 }
+# Card views are a fixed pool remapped per section, so they only need as many cards as the largest card section.
+RECORD_CARD_POOL_SIZE = max(count for section, (_start, count) in RECORD_SECTION_ROW_LAYOUT.items() if section != "Career")
+TEAM_RECORD_PREVIEW_ROWS = max(count for _start, count in TEAM_RECORD_SECTION_ROW_LAYOUT.values())
 HISTORY_AWARD_TYPES: dict[str, int] = {
     "Most Valuable Player": 8,
     "Rookie of the Year": 9,
@@ -186,6 +197,7 @@ class DpgEditorApp:
         self.current_screen = "Home"
         self.open_rows: dict[str, FieldEntry] = {}
         self.row_raw_values: dict[str, Any] = {}
+        self.row_loaded_texts: dict[str, str] = {}
         self.nav_button_tags: dict[str, str] = {}
         self.item_themes: dict[str, str] = {}
         self.history_section = "Season Awards"
@@ -197,6 +209,8 @@ class DpgEditorApp:
         self.team_record_stat = "Points"
         self.player_team_filter = PLAYER_TEAM_FILTER_ALL
         self.player_search_text = ""
+        self.player_search_sync_due: float | None = None
+        self.generator_display_cache: tuple[tuple[Any, ...], str] | None = None
         self.player_roster_export_folder = str(PLAYER_ROSTER_EXPORTS_DIR)
         self.player_roster_snapshot_filename = PLAYER_ROSTER_DEFAULT_EXPORT_FILE
         self.player_roster_snapshot_path = str(Path(self.player_roster_export_folder) / self.player_roster_snapshot_filename)
@@ -388,6 +402,8 @@ class DpgEditorApp:
         message_tag = self._operation_message_tag()
         progress_tag = self._operation_progress_tag()
         cancel_tag = self._operation_cancel_tag()
+        finished = overlay in {"complete", "failed", "cancelled"}
+        raise_popup = True
         if not dpg.does_item_exist(popup):
             with dpg.window(tag=popup, label="Operation Progress", modal=False, show=True, width=560, height=220, no_scrollbar=True):
                 dpg.add_text(message, tag=message_tag)
@@ -395,14 +411,18 @@ class DpgEditorApp:
                 dpg.add_progress_bar(tag=progress_tag, default_value=progress, overlay=overlay, width=-1)
                 dpg.add_spacer(height=10)
                 dpg.add_button(label="Cancel", tag=cancel_tag, width=100, callback=lambda *_args: self._request_operation_cancel(dpg))
+        elif hasattr(dpg, "is_item_shown") and dpg.is_item_shown(popup):
+            # Progress ticks on an open popup only update its contents; resizing and
+            # refocusing it every tick forces a fresh window layout each frame.
+            raise_popup = finished
         else:
             dpg.configure_item(popup, show=True, width=560, height=220, no_scrollbar=True)
         self._safe_set(dpg, message_tag, message)
         if dpg.does_item_exist(progress_tag):
             dpg.set_value(progress_tag, progress)
         self._safe_configure(dpg, progress_tag, overlay=overlay)
-        self._safe_configure(dpg, cancel_tag, enabled=overlay not in {"complete", "failed", "cancelled"})
-        if hasattr(dpg, "focus_item"):
+        self._safe_configure(dpg, cancel_tag, enabled=not finished)
+        if raise_popup and hasattr(dpg, "focus_item"):
             dpg.focus_item(popup)
 
     def _update_operation_progress(self, dpg: Any, current: int, total: int, message: str) -> None:
@@ -416,6 +436,8 @@ class DpgEditorApp:
             self.operation_events.append((event, value))
 
     def _pop_operation_events(self) -> list[tuple[str, Any]]:
+        if not self.operation_events:
+            return []
         with self.operation_events_lock:
             events = list(self.operation_events)
             self.operation_events.clear()
@@ -423,7 +445,12 @@ class DpgEditorApp:
 
     def _background_operation_progress(self, current: int, total: int, message: str) -> None:
         self._raise_if_operation_cancelled()
-        self._queue_operation_event("progress", (current, total, message))
+        with self.operation_events_lock:
+            # Only the latest progress matters to the next frame; replace a pending one.
+            if self.operation_events and self.operation_events[-1][0] == "progress":
+                self.operation_events[-1] = ("progress", (current, total, message))
+                return
+            self.operation_events.append(("progress", (current, total, message)))
 
     def _start_operation_thread(self, dpg: Any, label: str, worker: Any) -> None:
         if self.operation_thread is not None and self.operation_thread.is_alive():
@@ -571,10 +598,12 @@ class DpgEditorApp:
 
     def _sync_selection_state(self, domain: str, labels: list[str], selected_label: str) -> None:
         selected_labels = self.selected_item_labels.setdefault(domain, set())
-        selected_labels.intersection_update(set(labels))
-        if self.selection_anchors.get(domain) not in labels:
+        # One set serves every membership check; the list can hold thousands of players.
+        label_set = set(labels)
+        selected_labels.intersection_update(label_set)
+        if self.selection_anchors.get(domain) not in label_set:
             self.selection_anchors[domain] = None
-        if selected_label and labels and selected_label not in labels:
+        if selected_label and labels and selected_label not in label_set:
             selected_item = self.model.select_item_by_label(domain, labels[0])
             selected_label = selected_item.display_label if selected_item is not None else ""
         elif not labels:
@@ -588,24 +617,31 @@ class DpgEditorApp:
         content_tag = self._list_content_tag(domain)
         if not dpg.does_item_exist(content_tag):
             return
-        dpg.delete_item(content_tag, children_only=True)
         selected_labels = self.selected_item_labels.setdefault(domain, set())
-        with dpg.table(parent=content_tag, header_row=False, resizable=False, policy=dpg.mvTable_SizingStretchProp):
-            dpg.add_table_column()
-            for label in labels:
-                with dpg.table_row():
-                    dpg.add_selectable(
-                        label=label,
-                        tag=self._list_row_tag(domain, label),
-                        default_value=label in selected_labels,
-                        span_columns=True,
-                        callback=lambda *_args, d=domain, selected=label: self._select_item_label(dpg, d, selected),
-                    )
+        on_select = lambda _sender, _app_data, selected: self._select_item_label(dpg, domain, selected)
+        row_tag = self._list_row_tag
+        add_selectable = dpg.add_selectable
+        table_row = dpg.table_row
+        # Rebuild under one lock so the render thread lays the list out once, not per row.
+        with dpg.mutex():
+            dpg.delete_item(content_tag, children_only=True)
+            with dpg.table(parent=content_tag, header_row=False, resizable=False, clipper=True, policy=dpg.mvTable_SizingStretchProp):
+                dpg.add_table_column()
+                for label in labels:
+                    with table_row():
+                        add_selectable(
+                            label=label,
+                            tag=row_tag(domain, label),
+                            default_value=label in selected_labels,
+                            span_columns=True,
+                            callback=on_select,
+                            user_data=label,
+                        )
 
     def _modifier_down(self, dpg: Any, names: tuple[str, ...]) -> bool:
         return any((key := getattr(dpg, name, None)) is not None and dpg.is_key_down(key) for name in names)
 
-    def _sync_selection_rows(self, dpg: Any, domain: str, labels: list[str]) -> None:
+    def _sync_selection_rows(self, dpg: Any, domain: str, labels: Iterable[str]) -> None:
         selected_labels = self.selected_item_labels.setdefault(domain, set())
         for label in labels:
             tag = self._list_row_tag(domain, label)
@@ -617,6 +653,7 @@ class DpgEditorApp:
         if selected not in labels:
             return
         selected_labels = self.selected_item_labels.setdefault(domain, set())
+        previous_labels = set(selected_labels)
         ctrl = self._modifier_down(dpg, ("mvKey_LControl", "mvKey_RControl", "mvKey_Control"))
         shift = self._modifier_down(dpg, ("mvKey_LShift", "mvKey_RShift", "mvKey_Shift"))
         anchor = self.selection_anchors.get(domain)
@@ -632,7 +669,9 @@ class DpgEditorApp:
             self.selected_item_labels[domain] = {selected}
             self.selection_anchors[domain] = selected
         self.model.select_item_by_label(domain, selected)
-        self._sync_selection_rows(dpg, domain, labels)
+        changed_labels = previous_labels.symmetric_difference(self.selected_item_labels[domain])
+        changed_labels.add(selected)
+        self._sync_selection_rows(dpg, domain, changed_labels)
         self._update_detail_panel(dpg, domain)
 
     def _set_player_team_filter(self, dpg: Any, selected: str | None) -> None:
@@ -640,7 +679,15 @@ class DpgEditorApp:
         self._sync_player_list(dpg)
 
     def _set_player_search_text(self, dpg: Any, search_text: str | None) -> None:
+        # Keystrokes only record the text; the list is rebuilt once typing pauses.
         self.player_search_text = str(search_text or "")
+        self.player_search_sync_due = time.monotonic() + PLAYER_SEARCH_DEBOUNCE_SECONDS
+
+    def _poll_player_search(self, dpg: Any) -> None:
+        due = self.player_search_sync_due
+        if due is None or time.monotonic() < due:
+            return
+        self.player_search_sync_due = None
         self._sync_player_list(dpg)
 
     def _sync_record_screen_rows(self, dpg: Any, domain: str) -> None:
@@ -684,7 +731,7 @@ class DpgEditorApp:
                     self._safe_set(dpg, self._record_career_cell_tag(row_index, label), value)
             return
 
-        for row_index in range(RECORD_PREVIEW_CARDS):
+        for row_index in range(RECORD_CARD_POOL_SIZE):
             row_values = rows[row_index] if row_index < visible_rows else {}
             self._safe_configure(dpg, self._record_card_tag(row_index), show=row_index < visible_rows)
             self._safe_set(dpg, self._record_card_title_tag(row_index), f"Record #{row_index + 1}" if row_values else f"Record #{row_index + 1}")
@@ -748,22 +795,21 @@ class DpgEditorApp:
 
     def _render_history_table(self, dpg: Any, section: str, labels: tuple[str, ...], rows: list[dict[str, str]]) -> None:
         content_tag = self._history_table_content_tag(section)
-        self._safe_delete_children(dpg, content_tag)
-        with dpg.table(parent=content_tag, header_row=True, resizable=True, policy=dpg.mvTable_SizingStretchProp):
-            for label in labels:
-                dpg.add_table_column(label=label)
-            for row_index, row_values in enumerate(rows):
-                with dpg.table_row():
-                    for label in labels:
-                        value = str(row_index + 1) if label == "Rank" else self._history_cell_value(row_values, label)
-                        dpg.add_text(value, tag=self._history_preview_tag(section, row_index, label))
-
-    def _history_cell_value(self, row_values: dict[str, str], label: str) -> str:
-        source_label = {
-            "Winner Team City": "Team City",
-            "Winner Team Name": "Team Name",
-        }.get(label, label)
-        return row_values.get(source_label, "--")
+        columns = [(label, HISTORY_CELL_SOURCE_LABELS.get(label, label)) for label in labels]
+        preview_tag = self._history_preview_tag
+        add_text = dpg.add_text
+        table_row = dpg.table_row
+        # Build the whole table under one lock so it is laid out once, not once per cell.
+        with dpg.mutex():
+            self._safe_delete_children(dpg, content_tag)
+            with dpg.table(parent=content_tag, header_row=True, resizable=True, policy=dpg.mvTable_SizingStretchProp):
+                for label in labels:
+                    dpg.add_table_column(label=label)
+                for row_index, row_values in enumerate(rows):
+                    with table_row():
+                        for label, source_label in columns:
+                            value = str(row_index + 1) if label == "Rank" else row_values.get(source_label, "--")
+                            add_text(value, tag=preview_tag(section, row_index, label))
 
     def _history_type_for_tab(self, section: str, tab: str) -> int | None:
         if section == "Season Awards":
@@ -876,22 +922,64 @@ class DpgEditorApp:
         selected_text = str(selected or "")
         self.player_season_stat_id_selection[self._season_stat_selector_key(item)] = selected_text
         self._safe_set(dpg, self._season_stat_selector_tag(item), selected_text)
-        self._load_item_editor(dpg, item)
+        # Only the selected-season stat rows read through the selector; the rest of the record is unchanged.
+        self._load_item_editor(dpg, item, stat_details_only=True)
 
-    def _read_editor_entry_value(self, dpg: Any, item: RecordListItem, entry: FieldEntry) -> dict[str, Any]:
-        return self.model.read_entry_value(entry, index=item.index, stat_selector=self._selected_season_stat_selector(dpg, item, entry))
+    def _read_editor_entry_value(
+        self,
+        dpg: Any,
+        item: RecordListItem,
+        entry: FieldEntry,
+        record_addr: int | None = None,
+        memory: Any | None = None,
+    ) -> dict[str, Any]:
+        return self.model.read_entry_value(
+            entry,
+            index=item.index,
+            stat_selector=self._selected_season_stat_selector(dpg, item, entry),
+            record_addr=record_addr,
+            memory=memory,
+        )
 
-    def _write_editor_entry_value(self, dpg: Any, item: RecordListItem, entry: FieldEntry, value: str) -> dict[str, Any]:
-        return self.model.write_entry_value(entry, index=item.index, value=value, stat_selector=self._selected_season_stat_selector(dpg, item, entry))
+    def _write_editor_entry_value(
+        self,
+        dpg: Any,
+        item: RecordListItem,
+        entry: FieldEntry,
+        value: str,
+        record_addr: int | None = None,
+        memory: Any | None = None,
+    ) -> dict[str, Any]:
+        return self.model.write_entry_value(
+            entry,
+            index=item.index,
+            value=value,
+            stat_selector=self._selected_season_stat_selector(dpg, item, entry),
+            record_addr=record_addr,
+            memory=memory,
+        )
+
+    def _editor_record_address(self, domain: str, index: int) -> int | None:
+        try:
+            return self.model.record_address(domain, index)
+        except Exception:
+            return None
 
     def _mark_row_dirty(self, row_key: str) -> None:
         self.dirty_rows.add(row_key)
 
     def _selected_editor_items(self, domain: str, fallback_item: RecordListItem) -> list[RecordListItem]:
         selected_labels = self.selected_item_labels.get(domain, set())
-        loaded_items = self.model.player_items_for_team_filter(self.player_team_filter) if domain == "Players" else self.model.loaded_items.get(domain, {})
-        ordered_labels = self.model.player_item_labels_for_team_filter(self.player_team_filter, self.player_search_text) if domain == "Players" else self.model.domain_item_labels(domain)
-        items = [loaded_items[label] for label in ordered_labels if label in selected_labels and label in loaded_items]
+        if not selected_labels:
+            return [fallback_item]
+        filtered = domain == "Players" and (self.player_team_filter != PLAYER_TEAM_FILTER_ALL or bool(self.player_search_text.strip()))
+        if filtered:
+            loaded_items = self.model.player_items_for_team_filter(self.player_team_filter)
+            ordered_labels = self.model.player_item_labels_for_team_filter(self.player_team_filter, self.player_search_text)
+            items = [loaded_items[label] for label in ordered_labels if label in selected_labels and label in loaded_items]
+        else:
+            # Unfiltered lists show every loaded record in load order, so walk the items directly.
+            items = [loaded_item for label, loaded_item in self.model.loaded_items.get(domain, {}).items() if label in selected_labels]
         if not items:
             return [fallback_item]
         if fallback_item not in items:
@@ -904,55 +992,102 @@ class DpgEditorApp:
             return f"{item.domain} [{target_count} selected]"
         return f"{item.domain} [{item.index}] {item.label}"
 
-    def _load_item_editor(self, dpg: Any, item: RecordListItem) -> None:
+    def _load_item_editor(self, dpg: Any, item: RecordListItem, *, stat_details_only: bool = False) -> None:
         loaded = 0
         failed = 0
         prefix = f"{item.domain}:{item.index}:"
         rows = [(row_key, entry) for row_key, entry in self.open_rows.items() if row_key.startswith(prefix)]
+        if stat_details_only:
+            is_stat_detail = self.model.is_player_selected_stat_detail_entry
+            rows = [(row_key, entry) for row_key, entry in rows if is_stat_detail(entry)]
+        record_addr = self._editor_record_address(item.domain, item.index) if rows else None
+        block = self.model.record_block(item.domain, record_addr) if record_addr is not None else None
+        # Read every row first, then push all widget values in one pass while the
+        # render thread is held so the table never paints half-loaded.
+        pending: list[tuple[FieldEntry, str, str]] = []
+        read_value = self._read_editor_entry_value
+        raw_values = self.row_raw_values
+        loaded_texts = self.row_loaded_texts
         for row_key, entry in rows:
             try:
-                value = self._read_editor_entry_value(dpg, item, entry)
-                self.row_raw_values[row_key] = value.get("raw_value")
+                value = read_value(dpg, item, entry, record_addr, block)
+                raw_values[row_key] = value.get("raw_value")
                 text = str(value["display_value"])
-                dpg.set_value(self._row_current_tag(item, entry), text)
-                dpg.set_value(self._row_new_tag(item, entry), text)
-                dpg.set_value(self._row_status_tag(item, entry), f"0x{value['address']:X}")
+                pending.append((entry, text, f"0x{value['address']:X}"))
                 loaded += 1
             except Exception as exc:
-                self.row_raw_values.pop(row_key, None)
-                dpg.set_value(self._row_current_tag(item, entry), "")
-                dpg.set_value(self._row_new_tag(item, entry), "")
-                dpg.set_value(self._row_status_tag(item, entry), str(exc)[:90])
+                raw_values.pop(row_key, None)
+                text = ""
+                pending.append((entry, text, str(exc)[:90]))
                 failed += 1
-        self._safe_set(dpg, self._editor_status_tag(item), f"loaded {loaded} fields, {failed} unavailable")
+            loaded_texts[row_key] = text
+        set_value = dpg.set_value
+        current_tag = self._row_current_tag
+        new_tag = self._row_new_tag
+        status_tag = self._row_status_tag
+        with dpg.mutex():
+            for entry, text, status in pending:
+                set_value(current_tag(item, entry), text)
+                set_value(new_tag(item, entry), text)
+                set_value(status_tag(item, entry), status)
+        field_text = "season stat fields" if stat_details_only else "fields"
+        self._safe_set(dpg, self._editor_status_tag(item), f"loaded {loaded} {field_text}, {failed} unavailable")
 
     def _save_item_editor(self, dpg: Any, item: RecordListItem) -> None:
         saved = 0
         target_items = self._selected_editor_items(item.domain, item)
         prefix = f"{item.domain}:{item.index}:"
+        changed_rows: list[tuple[str, FieldEntry, str]] = []
+        get_value = dpg.get_value
+        new_tag = self._row_new_tag
+        loaded_text = self.row_loaded_texts.get
+        dirty_rows = self.dirty_rows
         for row_key, entry in self.open_rows.items():
             if not row_key.startswith(prefix):
                 continue
-            old_text = str(dpg.get_value(self._row_current_tag(item, entry)) or "")
-            new_text = str(dpg.get_value(self._row_new_tag(item, entry)) or "")
-            if new_text == old_text and row_key not in self.dirty_rows:
+            new_text = str(get_value(new_tag(item, entry)) or "")
+            if new_text == loaded_text(row_key) and row_key not in dirty_rows:
                 continue
-            field_saved = 0
-            source_readback: dict[str, Any] | None = None
+            changed_rows.append((row_key, entry, new_text))
+        field_saved: dict[str, int] = {row_key: 0 for row_key, _entry, _text in changed_rows}
+        source_readbacks: dict[str, dict[str, Any]] = {}
+        if changed_rows:
+            write_value = self._write_editor_entry_value
+            record_block = self.model.record_block
+            # Resolve the domain base once for every target instead of once per record.
+            record_addrs = self.model.record_addresses(item.domain, (target_item.index for target_item in target_items))
             for target_item in target_items:
-                readback = self._write_editor_entry_value(dpg, target_item, entry, new_text)
-                if target_item == item and isinstance(readback, dict):
-                    source_readback = readback
-                field_saved += 1
-            saved += field_saved
+                record_addr = record_addrs.get(target_item.index)
+                block = record_block(item.domain, record_addr, deferred=True) if record_addr is not None else None
+                try:
+                    for row_key, entry, new_text in changed_rows:
+                        readback = write_value(dpg, target_item, entry, new_text, record_addr, block)
+                        if target_item == item and isinstance(readback, dict):
+                            source_readbacks[row_key] = readback
+                        field_saved[row_key] += 1
+                except Exception:
+                    # Keep the fields written before the failure, but report the write error itself
+                    # rather than anything the flush raises afterwards.
+                    if block is not None:
+                        try:
+                            block.flush()
+                        except Exception:
+                            pass
+                    raise
+                if block is not None:
+                    block.flush()
+        for row_key, entry, _new_text in changed_rows:
+            saved += field_saved[row_key]
+            source_readback = source_readbacks.get(row_key)
             if source_readback is not None:
                 self.row_raw_values[row_key] = source_readback.get("raw_value")
                 text = str(source_readback["display_value"])
+                self.row_loaded_texts[row_key] = text
                 dpg.set_value(self._row_current_tag(item, entry), text)
                 dpg.set_value(self._row_new_tag(item, entry), text)
-                dpg.set_value(self._row_status_tag(item, entry), f"saved {field_saved} records @ 0x{source_readback['address']:X}")
+                dpg.set_value(self._row_status_tag(item, entry), f"saved {field_saved[row_key]} records @ 0x{source_readback['address']:X}")
             else:
-                dpg.set_value(self._row_status_tag(item, entry), f"saved {field_saved} records")
+                dpg.set_value(self._row_status_tag(item, entry), f"saved {field_saved[row_key]} records")
             self.dirty_rows.discard(row_key)
         record_text = "record" if len(target_items) == 1 else "records"
         message = f"saved {saved} field writes across {len(target_items)} {record_text}"
@@ -962,18 +1097,15 @@ class DpgEditorApp:
 
     def _reset_item_editor(self, dpg: Any, item: RecordListItem) -> None:
         target_items = self._selected_editor_items(item.domain, item)
-        total_succeeded = 0
-        total_failed = 0
-        for target_item in target_items:
-            result = self.model.reset_player_editor_values(
-                index=target_item.index,
-                stat_selector=self.player_season_stat_id_selection.get(self._season_stat_selector_key(item)),
-            )
-            total_succeeded += int(result.get("succeeded", 0))
-            total_failed += int(result.get("failed", 0))
+        result = self.model.reset_player_editor_values_for_indexes(
+            (target_item.index for target_item in target_items),
+            stat_selector=self.player_season_stat_id_selection.get(self._season_stat_selector_key(item)),
+        )
+        total_succeeded = int(result.get("succeeded", 0))
+        total_failed = int(result.get("failed", 0))
         message = f"reset {total_succeeded} fields across {len(target_items)} records, {total_failed} failed"
         self._safe_set(dpg, self._editor_status_tag(item), message)
-        if len(target_items) > 1:
+        if len(target_items) > 1 and total_succeeded:
             self._show_operation_popup(dpg, message, progress=1.0, overlay="complete")
 
     def _open_editor_window(self, dpg: Any, item: RecordListItem) -> None:
@@ -984,7 +1116,7 @@ class DpgEditorApp:
             dpg.focus_item(win_tag)
             return
 
-        def options_for(entry: FieldEntry) -> list[str]:
+        def options_for(entry: FieldEntry) -> tuple[str, ...]:
             return self.model.field_options(entry)
 
         def render_table(render_entries: list[FieldEntry]) -> None:
@@ -1047,7 +1179,7 @@ class DpgEditorApp:
                     rows = team_record_rows(self.model, item, self.team_record_section, self.team_record_stat)
                 except Exception:
                     rows = []
-                visible_rows = min(len(rows), RECORD_PREVIEW_CARDS)
+                visible_rows = min(len(rows), TEAM_RECORD_PREVIEW_ROWS)
                 career_mode = self.team_record_section == "Career"
                 for section in TEAM_RECORD_SIDE_NAV:
                     self._safe_configure(dpg, stat_group_tag(section), show=section == self.team_record_section)
@@ -1056,13 +1188,13 @@ class DpgEditorApp:
                 self._safe_configure(dpg, cards_container_tag(), show=not career_mode)
                 self._safe_configure(dpg, career_table_tag(), show=career_mode)
                 if career_mode:
-                    for row_index in range(RECORD_PREVIEW_CARDS):
+                    for row_index in range(TEAM_RECORD_PREVIEW_ROWS):
                         row_values = rows[row_index] if row_index < visible_rows else {}
                         for label in TEAM_RECORD_TABLE_LABELS:
                             value = str(row_index + 1) if label == "Rank" and row_values else row_values.get(label, "--")
                             self._safe_set(dpg, career_cell_tag(row_index, label), value)
                     return
-                for row_index in range(RECORD_PREVIEW_CARDS):
+                for row_index in range(TEAM_RECORD_PREVIEW_ROWS):
                     row_values = rows[row_index] if row_index < visible_rows else {}
                     self._safe_configure(dpg, card_tag(row_index), show=row_index < visible_rows)
                     self._safe_set(dpg, card_title_tag(row_index), f"Record #{row_index + 1}")
@@ -1084,9 +1216,7 @@ class DpgEditorApp:
 
             with dpg.group(horizontal=True):
                 with dpg.child_window(width=260, height=-1, border=False):
-                    for label in TEAM_RECORD_SIDE_NAV:
-                        dpg.add_button(label=label, width=-1, height=34, callback=lambda *_args, selected=label: set_team_record_section(selected))
-                        dpg.add_spacer(height=6)
+                    self._add_side_nav(dpg, TEAM_RECORD_SIDE_NAV, callback=set_team_record_section)
                 with dpg.child_window(width=-1, height=-1, border=True):
                     dpg.add_text(self.team_record_section, tag=heading_tag())
                     dpg.add_spacer(height=14)
@@ -1099,7 +1229,7 @@ class DpgEditorApp:
                     with dpg.child_window(width=-1, height=-1, border=True):
                         with dpg.group(tag=cards_container_tag(), show=True):
                             labels = RECORD_CARD_LABELS
-                            for row_index in range(RECORD_PREVIEW_CARDS):
+                            for row_index in range(TEAM_RECORD_PREVIEW_ROWS):
                                 with dpg.group(tag=card_tag(row_index), show=False):
                                     dpg.add_text(f"Record #{row_index + 1}", tag=card_title_tag(row_index))
                                     dpg.add_spacer(height=8)
@@ -1112,10 +1242,10 @@ class DpgEditorApp:
                                         dpg.add_spacer(height=8)
                                     dpg.add_spacer(height=18)
                         with dpg.group(tag=career_table_tag(), show=False):
-                            with dpg.table(header_row=True, resizable=True, policy=dpg.mvTable_SizingStretchProp):
+                            with dpg.table(header_row=True, resizable=True, clipper=True, policy=dpg.mvTable_SizingStretchProp):
                                 for label in TEAM_RECORD_TABLE_LABELS:
                                     dpg.add_table_column(label=label)
-                                for row_index in range(RECORD_PREVIEW_CARDS):
+                                for row_index in range(TEAM_RECORD_PREVIEW_ROWS):
                                     with dpg.table_row():
                                         for label in TEAM_RECORD_TABLE_LABELS:
                                             dpg.add_text("--", tag=career_cell_tag(row_index, label))
@@ -1339,13 +1469,17 @@ class DpgEditorApp:
 
     def _generator_grid_text(self, columns: tuple[str, ...], rows: tuple[Any, ...]) -> str:
         headers = ("Player", "Team", "Player ID", *columns)
-        table = [headers, *((str(row.player), str(row.source_team), str(row.player_id), *(str(value) for value in row.values)) for row in rows)]
+        shown = rows[:GENERATOR_DISPLAY_MAX_ROWS]
+        table = [headers, *((str(row.player), str(row.source_team), str(row.player_id), *(str(value) for value in row.values)) for row in shown)]
         widths = [max(len(record[index]) for record in table) for index in range(len(headers))]
 
         def render(record: tuple[str, ...]) -> str:
             return " | ".join(value.ljust(widths[index]) for index, value in enumerate(record))
 
-        return "\n".join((render(headers), "-+-".join("-" * width for width in widths), *(render(record) for record in table[1:])))
+        lines = [render(headers), "-+-".join("-" * width for width in widths), *(render(record) for record in table[1:])]
+        if len(rows) > len(shown):
+            lines.append(f"... {len(rows) - len(shown)} more players not shown")
+        return "\n".join(lines)
 
     def _generator_source_options_text(self, players: tuple[str, ...]) -> str:
         headers = ("Player", "Team", "Player ID")
@@ -1364,9 +1498,18 @@ class DpgEditorApp:
 
     def _generator_display_text(self, state: Any) -> str:
         player_rows = tuple(getattr(state, "player_rows", ()))
+        columns = tuple(getattr(state, "field_columns", ()))
+        players = tuple(getattr(state, "players", ()))
+        key = (player_rows, columns, players) if player_rows else ((), (), players)
+        cached = self.generator_display_cache
+        if cached is not None and all(old is new for old, new in zip(cached[0], key)):
+            return cached[1]
         if player_rows:
-            return self._generator_grid_text(tuple(getattr(state, "field_columns", ())), player_rows)
-        return self._generator_source_options_text(tuple(getattr(state, "players", ())))
+            text = self._generator_grid_text(columns, player_rows)
+        else:
+            text = self._generator_source_options_text(players)
+        self.generator_display_cache = (key, text)
+        return text
 
     def _sync_player_generator_status(self, dpg: Any) -> None:
         state = self.player_generator_state
@@ -1377,7 +1520,10 @@ class DpgEditorApp:
         self._safe_configure(dpg, self._player_generator_tag("selected_player"), items=list(getattr(state, "players", ())))
         self._safe_set(dpg, self._player_generator_tag("selected_player"), getattr(state, "selected_player", ""))
         self._safe_set(dpg, self._player_generator_tag("status"), getattr(state, "status", ""))
-        self._safe_set(dpg, self._generator_table_tag(), self._generator_display_text(state))
+        cached = self.generator_display_cache
+        text = self._generator_display_text(state)
+        if cached is None or text is not cached[1]:
+            self._safe_set(dpg, self._generator_table_tag(), text)
 
     def _player_roster_snapshot_path(self, dpg: Any) -> Path:
         folder_raw = str(
@@ -1752,11 +1898,18 @@ class DpgEditorApp:
                         dpg.add_button(label="Edit Team", width=120, callback=lambda *_args: self._open_selected(dpg, domain))
                         dpg.add_button(label="Zero All Team Record Data", width=190, callback=lambda *_args: self._zero_all_team_record_data_values(dpg))
 
+    def _add_side_nav(self, dpg: Any, labels: Iterable[str], *, callback: Any) -> None:
+        on_click = lambda _sender, _app_data, selected: callback(selected)
+        for label in labels:
+            dpg.add_button(label=label, width=-1, height=34, callback=on_click, user_data=label)
+            dpg.add_spacer(height=6)
+
     def _add_button_strip(self, dpg: Any, labels: tuple[str, ...], *, per_row: int, callback: Any | None = None) -> None:
+        on_click = (lambda _sender, _app_data, selected: callback(selected)) if callback else None
         for start in range(0, len(labels), per_row):
             with dpg.group(horizontal=True):
                 for label in labels[start : start + per_row]:
-                    dpg.add_button(label=label, height=28, callback=(lambda *_args, selected=label: callback(selected)) if callback else None)
+                    dpg.add_button(label=label, height=28, callback=on_click, user_data=label)
             dpg.add_spacer(height=6)
 
     def _build_history_screen(self, dpg: Any, *, show: bool = False) -> None:
@@ -1768,15 +1921,14 @@ class DpgEditorApp:
                     dpg.add_spacer(height=6)
                     dpg.add_button(label="Edit Selected History Row", width=-1, callback=lambda *_args: self._open_selected(dpg, domain))
                     dpg.add_spacer(height=18)
-                    for label in HISTORY_SIDE_NAV:
-                        dpg.add_button(label=label, width=-1, height=34, callback=lambda *_args, selected=label: self._set_history_section(dpg, selected))
-                        dpg.add_spacer(height=6)
+                    self._add_side_nav(dpg, HISTORY_SIDE_NAV, callback=lambda selected: self._set_history_section(dpg, selected))
                 with dpg.child_window(width=-1, height=-1, border=True):
                     dpg.add_text(self.history_section, tag=self._heading_tag(domain))
                     dpg.add_spacer(height=14)
+                    set_tab = lambda selected: self._set_history_tab(dpg, selected)
                     for section, tabs in HISTORY_SECTION_TABS.items():
                         with dpg.group(tag=self._history_tab_group_tag(section), show=section == self.history_section):
-                            self._add_button_strip(dpg, tabs, per_row=5, callback=lambda selected: self._set_history_tab(dpg, selected))
+                            self._add_button_strip(dpg, tabs, per_row=5, callback=set_tab)
                     dpg.add_spacer(height=8)
                     dpg.add_text(self._game_status_text(), tag=self._status_tag(domain))
                     dpg.add_text("NBA History: 0", tag=self._count_tag(domain))
@@ -1793,15 +1945,14 @@ class DpgEditorApp:
                 with dpg.child_window(width=260, height=-1, border=False):
                     dpg.add_button(label="Refresh", width=-1, callback=lambda *_args: self._attach_and_scan(dpg, domain))
                     dpg.add_spacer(height=18)
-                    for label in RECORD_SIDE_NAV:
-                        dpg.add_button(label=label, width=-1, height=34, callback=lambda *_args, selected=label: self._set_record_section(dpg, selected))
-                        dpg.add_spacer(height=6)
+                    self._add_side_nav(dpg, RECORD_SIDE_NAV, callback=lambda selected: self._set_record_section(dpg, selected))
                 with dpg.child_window(width=-1, height=-1, border=True):
                     dpg.add_text(self.record_section, tag=self._heading_tag(domain))
                     dpg.add_spacer(height=14)
+                    set_stat = lambda selected: self._set_record_stat(dpg, selected)
                     for section, tabs in RECORD_SECTION_STAT_TABS.items():
                         with dpg.group(tag=self._record_stat_group_tag(section), show=section == self.record_section):
-                            self._add_button_strip(dpg, tabs, per_row=13, callback=lambda selected: self._set_record_stat(dpg, selected))
+                            self._add_button_strip(dpg, tabs, per_row=13, callback=set_stat)
                     dpg.add_spacer(height=8)
                     dpg.add_text(self._game_status_text(), tag=self._status_tag(domain))
                     dpg.add_text("NBA Records: 0", tag=self._count_tag(domain))
@@ -1812,7 +1963,7 @@ class DpgEditorApp:
                     with dpg.child_window(width=-1, height=-1, border=True):
                         with dpg.group(tag=self._record_cards_container_tag(), show=True):
                             labels = RECORD_CARD_LABELS
-                            for row_index in range(RECORD_PREVIEW_CARDS):
+                            for row_index in range(RECORD_CARD_POOL_SIZE):
                                 with dpg.group(tag=self._record_card_tag(row_index), show=row_index < RECORD_SECTION_ROW_LAYOUT[self.record_section][1]):
                                     dpg.add_text(f"Record #{row_index + 1}", tag=self._record_card_title_tag(row_index))
                                     dpg.add_spacer(height=8)
@@ -1825,7 +1976,7 @@ class DpgEditorApp:
                                         dpg.add_spacer(height=8)
                                     dpg.add_spacer(height=18)
                         with dpg.group(tag=self._record_career_table_tag(), show=False):
-                            with dpg.table(header_row=True, resizable=True, policy=dpg.mvTable_SizingStretchProp):
+                            with dpg.table(header_row=True, resizable=True, clipper=True, policy=dpg.mvTable_SizingStretchProp):
                                 for label in RECORD_CAREER_TABLE_LABELS:
                                     dpg.add_table_column(label=label)
                                 for row_index in range(RECORD_PREVIEW_CARDS):
@@ -1919,6 +2070,7 @@ class DpgEditorApp:
         while dpg.is_dearpygui_running():
             self._poll_background_scan(dpg)
             self._poll_background_operation(dpg)
+            self._poll_player_search(dpg)
             dpg.render_dearpygui_frame()
 
 